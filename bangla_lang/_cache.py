@@ -0,0 +1,84 @@
+"""On-disk cache of parsed and compiled programs, keyed by source text.
+
+Running an unchanged file again (test loops, editors re-running a script)
+skips lexing and parsing, and with `cached_compile` compiling too: the
+`Program` or `CodeObject` pickled on the first run is loaded instead. Bump
+CACHE_VERSION whenever the lexer, parser, AST classes, compiler or bytecode
+format change in a way that alters the result, so stale entries are never
+read back.
+"""
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from typing import Any, Optional
+
+from .ast import Program
+from .bytecode import CodeObject
+from .compiler import Compiler
+from .lexer import lex
+from .parser import parse_tokens
+
+CACHE_VERSION = 6
+CACHE_DIR = os.path.expanduser("~/.bpl_cache")
+
+
+def _cache_path(source: str, suffix: str = ".pkl") -> str:
+    key = hashlib.blake2b(f"{CACHE_VERSION}\0{source}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, key + suffix)
+
+
+def _load(path: str, cls: type) -> Optional[Any]:
+    try:
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+        if isinstance(obj, cls):
+            return obj
+    except Exception:
+        pass
+    return None
+
+
+def _store(path: str, obj: Any) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=64)
+def cached_parse(source: str) -> Program:
+    """Return the AST for `source`, from the cache when possible.
+
+    The returned tree is shared between callers and must not be mutated.
+    Cache read/write failures are ignored; the source is then parsed as usual.
+    """
+    path = _cache_path(source)
+    tree = _load(path, Program)
+    if tree is None:
+        tree = parse_tokens(lex(source))
+        _store(path, tree)
+    return tree
+
+
+@lru_cache(maxsize=64)
+def cached_compile(source: str) -> CodeObject:
+    """Return the compiled module code for `source`, from the cache when possible.
+
+    The code object is shared between callers. Running it is fine (the VM
+    only touches its call counters and inline caches, which are valid for
+    any VM), but it must not be modified. Entries store only what the
+    compiler produced (instructions, constants, names, varnames, argcount,
+    name and callees); a CodeObject pickles without its run-time state,
+    so call counts, threaded handlers and generated code are never saved.
+    """
+    path = _cache_path(source, ".bpc")
+    code = _load(path, CodeObject)
+    if code is None:
+        code = Compiler().compile(cached_parse(source))
+        _store(path, code)
+    return code
@@ -0,0 +1,134 @@
+"""Precomputed Unicode tables for unicode_variants.
+
+Generated by tools/gen_variants.py; do not edit by hand.
+"""
+
+UNIDATA_VERSION = '14.0.0'
+
+# Inclusive runs of BMP combining marks (Mn, Mc, Me)
+MARK_RANGES = [
+    (0x0300, 0x036f), (0x0483, 0x0489), (0x0591, 0x05bd), (0x05bf, 0x05bf),
+    (0x05c1, 0x05c2), (0x05c4, 0x05c5), (0x05c7, 0x05c7), (0x0610, 0x061a),
+    (0x064b, 0x065f), (0x0670, 0x0670), (0x06d6, 0x06dc), (0x06df, 0x06e4),
+    (0x06e7, 0x06e8), (0x06ea, 0x06ed), (0x0711, 0x0711), (0x0730, 0x074a),
+    (0x07a6, 0x07b0), (0x07eb, 0x07f3), (0x07fd, 0x07fd), (0x0816, 0x0819),
+    (0x081b, 0x0823), (0x0825, 0x0827), (0x0829, 0x082d), (0x0859, 0x085b),
+    (0x0898, 0x089f), (0x08ca, 0x08e1), (0x08e3, 0x0903), (0x093a, 0x093c),
+    (0x093e, 0x094f), (0x0951, 0x0957), (0x0962, 0x0963), (0x0981, 0x0983),
+    (0x09bc, 0x09bc), (0x09be, 0x09c4), (0x09c7, 0x09c8), (0x09cb, 0x09cd),
+    (0x09d7, 0x09d7), (0x09e2, 0x09e3), (0x09fe, 0x09fe), (0x0a01, 0x0a03),
+    (0x0a3c, 0x0a3c), (0x0a3e, 0x0a42), (0x0a47, 0x0a48), (0x0a4b, 0x0a4d),
+    (0x0a51, 0x0a51), (0x0a70, 0x0a71), (0x0a75, 0x0a75), (0x0a81, 0x0a83),
+    (0x0abc, 0x0abc), (0x0abe, 0x0ac5), (0x0ac7, 0x0ac9), (0x0acb, 0x0acd),
+    (0x0ae2, 0x0ae3), (0x0afa, 0x0aff), (0x0b01, 0x0b03), (0x0b3c, 0x0b3c),
+    (0x0b3e, 0x0b44), (0x0b47, 0x0b48), (0x0b4b, 0x0b4d), (0x0b55, 0x0b57),
+    (0x0b62, 0x0b63), (0x0b82, 0x0b82), (0x0bbe, 0x0bc2), (0x0bc6, 0x0bc8),
+    (0x0bca, 0x0bcd), (0x0bd7, 0x0bd7), (0x0c00, 0x0c04), (0x0c3c, 0x0c3c),
+    (0x0c3e, 0x0c44), (0x0c46, 0x0c48), (0x0c4a, 0x0c4d), (0x0c55, 0x0c56),
+    (0x0c62, 0x0c63), (0x0c81, 0x0c83), (0x0cbc, 0x0cbc), (0x0cbe, 0x0cc4),
+    (0x0cc6, 0x0cc8), (0x0cca, 0x0ccd), (0x0cd5, 0x0cd6), (0x0ce2, 0x0ce3),
+    (0x0d00, 0x0d03), (0x0d3b, 0x0d3c), (0x0d3e, 0x0d44), (0x0d46, 0x0d48),
+    (0x0d4a, 0x0d4d), (0x0d57, 0x0d57), (0x0d62, 0x0d63), (0x0d81, 0x0d83),
+    (0x0dca, 0x0dca), (0x0dcf, 0x0dd4), (0x0dd6, 0x0dd6), (0x0dd8, 0x0ddf),
+    (0x0df2, 0x0df3), (0x0e31, 0x0e31), (0x0e34, 0x0e3a), (0x0e47, 0x0e4e),
+    (0x0eb1, 0x0eb1), (0x0eb4, 0x0ebc), (0x0ec8, 0x0ecd), (0x0f18, 0x0f19),
+    (0x0f35, 0x0f35), (0x0f37, 0x0f37), (0x0f39, 0x0f39), (0x0f3e, 0x0f3f),
+    (0x0f71, 0x0f84), (0x0f86, 0x0f87), (0x0f8d, 0x0f97), (0x0f99, 0x0fbc),
+    (0x0fc6, 0x0fc6), (0x102b, 0x103e), (0x1056, 0x1059), (0x105e, 0x1060),
+    (0x1062, 0x1064), (0x1067, 0x106d), (0x1071, 0x1074), (0x1082, 0x108d),
+    (0x108f, 0x108f), (0x109a, 0x109d), (0x135d, 0x135f), (0x1712, 0x1715),
+    (0x1732, 0x1734), (0x1752, 0x1753), (0x1772, 0x1773), (0x17b4, 0x17d3),
+    (0x17dd, 0x17dd), (0x180b, 0x180d), (0x180f, 0x180f), (0x1885, 0x1886),
+    (0x18a9, 0x18a9), (0x1920, 0x192b), (0x1930, 0x193b), (0x1a17, 0x1a1b),
+    (0x1a55, 0x1a5e), (0x1a60, 0x1a7c), (0x1a7f, 0x1a7f), (0x1ab0, 0x1ace),
+    (0x1b00, 0x1b04), (0x1b34, 0x1b44), (0x1b6b, 0x1b73), (0x1b80, 0x1b82),
+    (0x1ba1, 0x1bad), (0x1be6, 0x1bf3), (0x1c24, 0x1c37), (0x1cd0, 0x1cd2),
+    (0x1cd4, 0x1ce8), (0x1ced, 0x1ced), (0x1cf4, 0x1cf4), (0x1cf7, 0x1cf9),
+    (0x1dc0, 0x1dff), (0x20d0, 0x20f0), (0x2cef, 0x2cf1), (0x2d7f, 0x2d7f),
+    (0x2de0, 0x2dff), (0x302a, 0x302f), (0x3099, 0x309a), (0xa66f, 0xa672),
+    (0xa674, 0xa67d), (0xa69e, 0xa69f), (0xa6f0, 0xa6f1), (0xa802, 0xa802),
+    (0xa806, 0xa806), (0xa80b, 0xa80b), (0xa823, 0xa827), (0xa82c, 0xa82c),
+    (0xa880, 0xa881), (0xa8b4, 0xa8c5), (0xa8e0, 0xa8f1), (0xa8ff, 0xa8ff),
+    (0xa926, 0xa92d), (0xa947, 0xa953), (0xa980, 0xa983), (0xa9b3, 0xa9c0),
+    (0xa9e5, 0xa9e5), (0xaa29, 0xaa36), (0xaa43, 0xaa43), (0xaa4c, 0xaa4d),
+    (0xaa7b, 0xaa7d), (0xaab0, 0xaab0), (0xaab2, 0xaab4), (0xaab7, 0xaab8),
+    (0xaabe, 0xaabf), (0xaac1, 0xaac1), (0xaaeb, 0xaaef), (0xaaf5, 0xaaf6),
+    (0xabe3, 0xabea), (0xabec, 0xabed), (0xfb1e, 0xfb1e), (0xfe00, 0xfe0f),
+    (0xfe20, 0xfe2f),
+]
+
+# Source dicts the normalized tables below were built from
+KEYWORD_VARIANTS = {
+    'যদি': 'যদি',
+    'নইলে': 'নইলে',
+    'অন্যথায়': 'নইলে',
+    'নইতো': 'নইলে',
+    'যখন': 'যখন',
+    'যতক্ষণ': 'যখন',
+    'ফাংশন': 'ফাংশন',
+    'ফংশন': 'ফাংশন',
+    'ফাংশণ': 'ফাংশন',
+    'ফলাফল': 'ফলাফল',
+    'ফেরত': 'ফলাফল',
+    'রিটার্ন': 'ফলাফল',
+    'সত্য': 'সত্য',
+    'সঁচা': 'সত্য',
+    'ঠিক': 'সত্য',
+    'মিথ্যা': 'মিথ্যা',
+    'মিথা': 'মিথ্যা',
+    'ভুল': 'মিথ্যা',
+    'নিল': 'নিল',
+    'শূন্য': 'নিল',
+    'কোনো': 'নিল',
+    'দেখাও': 'দেখাও',
+    'মুদ্রণ': 'দেখাও',
+    'প্রিন্ট': 'দেখাও',
+    'ছাপো': 'দেখাও',
+}
+
+LOGICAL_OPERATORS = {
+    'এবং': 'এবং',
+    'এবাং': 'এবং',
+    'ও': 'এবং',
+    'বা': 'বা',
+    'অথবা': 'বা',
+    'অথবো': 'বা',
+    'না': 'না',
+    'নয়': 'না',
+}
+
+NORM_KEYWORD_VARIANTS = {
+    'যদ': 'যদি',
+    'নইল': 'নইলে',
+    'অনযথয': 'নইলে',
+    'নইত': 'নইলে',
+    'যখন': 'যখন',
+    'যতকষণ': 'যখন',
+    'ফশন': 'ফাংশন',
+    'ফশণ': 'ফাংশন',
+    'ফলফল': 'ফলাফল',
+    'ফরত': 'ফলাফল',
+    'রটরন': 'ফলাফল',
+    'সতয': 'সত্য',
+    'সচ': 'সত্য',
+    'ঠক': 'সত্য',
+    'মথয': 'মিথ্যা',
+    'মথ': 'মিথ্যা',
+    'ভল': 'মিথ্যা',
+    'নল': 'নিল',
+    'শনয': 'নিল',
+    'কন': 'নিল',
+    'দখও': 'দেখাও',
+    'মদরণ': 'দেখাও',
+    'পরনট': 'দেখাও',
+    'ছপ': 'দেখাও',
+}
+
+NORM_LOGICAL_OPERATORS = {
+    'এব': 'এবং',
+    'ও': 'এবং',
+    'ব': 'বা',
+    'অথব': 'বা',
+    'ন': 'না',
+    'নয': 'না',
+}
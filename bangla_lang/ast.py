@@ -1,18 +1,38 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, List, Optional
 
 
+def _slots(cls):
+    """Rebuild a dataclass with `__slots__` for its own fields.
+
+    Equivalent to `dataclass(slots=True)`, which needs Python 3.10. Nodes are
+    created for every operand and operator, so dropping the per-instance
+    `__dict__` noticeably cuts AST memory and attribute access time.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    own = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    ns = {k: v for k, v in cls.__dict__.items() if k not in own and k not in ("__dict__", "__weakref__")}
+    ns["__slots__"] = own
+    return type(cls)(cls.__name__, cls.__bases__, ns)
+
+
+@_slots
 @dataclass
 class Node:
+    # Source positions live on the node itself, as two slots. A side table
+    # keyed by node identity would not survive pickling (see _cache) and
+    # would drop positions out of node equality and repr.
     lineno: int = 0
     col: int = 0
 
 
+@_slots
 @dataclass
 class Program(Node):
     body: List[Any] = None
 
 
+@_slots
 @dataclass
 class FunctionDef(Node):
     name: str = ""
@@ -20,6 +40,7 @@ class FunctionDef(Node):
     body: List[Any] = None
 
 
+@_slots
 @dataclass
 class If(Node):
     test: Any = None
@@ -27,28 +48,33 @@ class If(Node):
     orelse: List[Any] = None
 
 
+@_slots
 @dataclass
 class While(Node):
     test: Any = None
     body: List[Any] = None
 
 
+@_slots
 @dataclass
 class Return(Node):
     value: Any = None
 
 
+@_slots
 @dataclass
 class Assign(Node):
     target: Any = None
     value: Any = None
 
 
+@_slots
 @dataclass
 class ExprStmt(Node):
     value: Any = None
 
 
+@_slots
 @dataclass
 class BinaryOp(Node):
     left: Any = None
@@ -56,23 +82,27 @@ class BinaryOp(Node):
     right: Any = None
 
 
+@_slots
 @dataclass
 class UnaryOp(Node):
     op: str = ""
     operand: Any = None
 
 
+@_slots
 @dataclass
 class Call(Node):
     func: Any = None
     args: List[Any] = None
 
 
+@_slots
 @dataclass
 class Identifier(Node):
     name: str = ""
 
 
+@_slots
 @dataclass
 class Literal(Node):
     value: Any = None
@@ -2,163 +2,684 @@
 
 This is an initial stack-based bytecode VM and CodeObject representation.
 It is intentionally small so we can iterate: supports constants, names,
-basic binary ops, function definitions (as nested CodeObject), and CALL/RETURN.
+arithmetic/comparison/logical ops, conditional and unconditional jumps,
+function definitions (as nested CodeObject), and CALL/RETURN.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
-import types
+from dataclasses import dataclass, field
+from collections import Counter
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+import itertools
+import operator
 
+from . import runtime
+from .errors import RuntimeErrorBPL
 
-# Opcode names
-LOAD_CONST = "LOAD_CONST"
-LOAD_NAME = "LOAD_NAME"
-STORE_NAME = "STORE_NAME"
-POP_TOP = "POP_TOP"
-BINARY_ADD = "BINARY_ADD"
-BINARY_SUB = "BINARY_SUB"
-BINARY_MUL = "BINARY_MUL"
-BINARY_DIV = "BINARY_DIV"
-RETURN_VALUE = "RETURN_VALUE"
-CALL_FUNCTION = "CALL_FUNCTION"
 
+# Builtins every VM starts with
+_DEFAULT_BUILTINS: Dict[str, Any] = {
+    "দেখাও": runtime.bpl_print,
+    "প্রকার": runtime.bpl_type,
+}
 
-@dataclass
-class Instruction:
-    op: str
+# Opcodes are small ints so the VM can dispatch by list index.
+LOAD_CONST = 0
+LOAD_NAME = 1
+STORE_NAME = 2
+POP_TOP = 3
+BINARY_ADD = 4
+BINARY_SUB = 5
+BINARY_MUL = 6
+BINARY_DIV = 7
+RETURN_VALUE = 8
+CALL_FUNCTION = 9
+LOAD_FAST = 10
+STORE_FAST = 11
+# Super-instructions: LOAD_FAST i; LOAD_FAST j; BINARY_<op> fused into
+# <op>_FF with arg (i, j), and LOAD_FAST i; LOAD_CONST j; BINARY_<op> into
+# <op>_FC with arg (i, j). Emitted by the compiler's peephole pass.
+FAST_ADD_FF = 12
+FAST_ADD_FC = 13
+FAST_SUB_FF = 14
+FAST_SUB_FC = 15
+FAST_MUL_FF = 16
+FAST_MUL_FC = 17
+FAST_DIV_FF = 18
+FAST_DIV_FC = 19
+BINARY_MOD = 20
+COMPARE_EQ = 21
+COMPARE_NE = 22
+COMPARE_LT = 23
+COMPARE_GT = 24
+COMPARE_LE = 25
+COMPARE_GE = 26
+# Bangla এবং / বা: both operands are evaluated, the result is a bool
+LOGICAL_AND = 27
+LOGICAL_OR = 28
+UNARY_NOT = 29
+# Jumps take an absolute instruction index
+JUMP_ABSOLUTE = 30
+POP_JUMP_IF_FALSE = 31
+# LOAD_CONST i; RETURN_VALUE fused by the peephole pass
+RETURN_CONST = 32
+# CALL_FUNCTION n; RETURN_VALUE fused by the peephole pass
+CALL_RETURN = 33
+# Functions defined inside a function: MAKE_FUNCTION turns the code object
+# on the stack into a `Closure` over the current frame, and LOAD_FREE reads
+# a name through the enclosing frames (then globals and builtins).
+MAKE_FUNCTION = 34
+LOAD_FREE = 35
+
+OPNAMES = [
+    "LOAD_CONST",
+    "LOAD_NAME",
+    "STORE_NAME",
+    "POP_TOP",
+    "BINARY_ADD",
+    "BINARY_SUB",
+    "BINARY_MUL",
+    "BINARY_DIV",
+    "RETURN_VALUE",
+    "CALL_FUNCTION",
+    "LOAD_FAST",
+    "STORE_FAST",
+    "FAST_ADD_FF",
+    "FAST_ADD_FC",
+    "FAST_SUB_FF",
+    "FAST_SUB_FC",
+    "FAST_MUL_FF",
+    "FAST_MUL_FC",
+    "FAST_DIV_FF",
+    "FAST_DIV_FC",
+    "BINARY_MOD",
+    "COMPARE_EQ",
+    "COMPARE_NE",
+    "COMPARE_LT",
+    "COMPARE_GT",
+    "COMPARE_LE",
+    "COMPARE_GE",
+    "LOGICAL_AND",
+    "LOGICAL_OR",
+    "UNARY_NOT",
+    "JUMP_ABSOLUTE",
+    "POP_JUMP_IF_FALSE",
+    "RETURN_CONST",
+    "CALL_RETURN",
+    "MAKE_FUNCTION",
+    "LOAD_FREE",
+]
+
+JUMP_OPS = (JUMP_ABSOLUTE, POP_JUMP_IF_FALSE)
+
+# BINARY_<op> -> (fused LOAD_FAST/LOAD_FAST form, fused LOAD_FAST/LOAD_CONST form)
+FUSED_BINARY = {
+    BINARY_ADD: (FAST_ADD_FF, FAST_ADD_FC),
+    BINARY_SUB: (FAST_SUB_FF, FAST_SUB_FC),
+    BINARY_MUL: (FAST_MUL_FF, FAST_MUL_FC),
+    BINARY_DIV: (FAST_DIV_FF, FAST_DIV_FC),
+}
+
+
+class Instruction(NamedTuple):
+    op: int
     arg: Any = None
 
+    def __repr__(self) -> str:
+        return f"Instruction({OPNAMES[self.op]}, {self.arg!r})"
+
 
 @dataclass
 class CodeObject:
-    instructions: List[Instruction]
+    # Instructions are stored as two parallel sequences (opcode, argument)
+    # so the VM can fetch each with a plain indexed load. The compiler
+    # freezes them once peephole is done: one byte per opcode, like
+    # CPython's co_code, and an exact-size tuple of arguments.
+    ops: bytes
+    args: Tuple[Any, ...]
     consts: List[Any]
     names: List[str]
     argcount: int = 0
+    # Function-local variable names (parameters first), addressed by
+    # LOAD_FAST/STORE_FAST through a per-frame slot list.
+    varnames: List[str] = field(default_factory=list)
+    # Function name, for error messages
+    name: str = "<module>"
+    # Indices into `names` that are loaded as the callee of a call, so an
+    # unbound or uncallable value is reported as an unknown function
+    callees: FrozenSet[int] = frozenset()
+    # Call counter (see `VM.promote`) and the opcodes pre-resolved to handler
+    # functions, built on first execution against the dispatch table in
+    # `threaded_by` (see `VM.thread`).
+    calls: int = field(default=0, compare=False, repr=False)
+    threaded: Optional[List[Any]] = field(default=None, compare=False, repr=False)
+    threaded_by: Optional[List[Any]] = field(default=None, compare=False, repr=False)
+    # Straight-line Python translation of a hot function, if it has one
+    # (see `Compiler.to_python_function`).
+    pyfunc: Optional[Callable[..., Any]] = field(default=None, compare=False, repr=False)
+    # Inline cache for LOAD_NAME, one (epoch, dict, name) entry per name; see
+    # `VM._op_load_name`.
+    name_cache: List[Any] = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.name_cache = [None] * len(self.names)
+
+    # Only the compiled code is pickled (see `_cache`). The run-time state
+    # above belongs to the process that ran it: threaded handlers may be
+    # profiling closures and `pyfunc` is generated code, neither picklable.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "ops": self.ops, "args": self.args, "consts": self.consts,
+            "names": self.names, "argcount": self.argcount,
+            "varnames": self.varnames, "name": self.name,
+            "callees": self.callees,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @property
+    def instructions(self) -> List[Instruction]:
+        """The instruction stream as `Instruction` tuples (for inspection)."""
+        return [Instruction(op, arg) for op, arg in zip(self.ops, self.args)]
+
+
+# Marks a fast local slot that has not been assigned yet.
+_UNBOUND = object()
+
+
+class Closure:
+    """A function defined inside another function's body.
+
+    `scope` links the fast locals of the frames it was defined in, as
+    (fastlocals, varnames, enclosing scope) tuples ending in None. The lists
+    are shared with those frames, so the function sees names they bind
+    later, as the evaluator's environments do.
+    """
+    __slots__ = ("code", "scope")
+
+    def __init__(self, code: CodeObject, scope: Optional[Tuple[Any, ...]]):
+        self.code = code
+        self.scope = scope
+
+
+class _Uncallable:
+    """Loaded in place of a callee name that is unbound or not a function.
+
+    The call reports the name only once its arguments are evaluated, as
+    the evaluator does.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+def _as_callee(val: Any, name: str) -> Any:
+    if callable(val) or type(val) is CodeObject or type(val) is Closure:
+        return val
+    return _Uncallable(name)
 
 
 class Frame:
-    def __init__(self, code: CodeObject, globals_: Dict[str, Any], locals_: Dict[str, Any]):
+    __slots__ = ("code", "globals", "locals", "fastlocals", "scope", "stack", "pc")
+
+    def __init__(
+        self,
+        code: CodeObject,
+        globals_: Dict[str, Any],
+        locals_: Dict[str, Any],
+        fastlocals: Optional[List[Any]] = None,
+        scope: Optional[Tuple[Any, ...]] = None,
+    ):
         self.code = code
         self.globals = globals_
         self.locals = locals_
+        self.scope = scope
+        if fastlocals is None:
+            fastlocals = [_UNBOUND] * len(code.varnames)
+            if locals_:
+                for i, name in enumerate(code.varnames):
+                    if name in locals_:
+                        fastlocals[i] = locals_[name]
+        self.fastlocals: List[Any] = fastlocals
+        # A growable list rather than a preallocated stack with an explicit
+        # top index: lists cannot reserve capacity, and keeping the index on
+        # the frame measured about 10% slower than append/pop.
         self.stack: List[Any] = []
         self.pc = 0
 
 
-class VMError(Exception):
+class VMError(RuntimeErrorBPL):
+    # A RuntimeErrorBPL, with the evaluator's messages, so callers handle
+    # failures the same way whichever backend ran the program.
     pass
 
 
+# Source of name-binding epochs. A VM takes a fresh one whenever the
+# namespace a name resolves in may have changed, which invalidates every
+# LOAD_NAME cache entry.
+_EPOCHS = itertools.count()
+
+# Returned by an opcode handler to end execution of the current frame.
+_RETURN = object()
+# Returned by a jump handler after it has stored the target in `frame.pc`.
+_JUMP = object()
+
+
+def _counting(handler: Callable[..., Any], op: int, counts: Counter):
+    def counted(self, frame: Frame, arg):
+        counts[op] += 1
+        return handler(self, frame, arg)
+    return counted
+
+
+# Handlers for BINARY_MOD and the comparisons, calling the `operator`
+# function (the arithmetic ones, `_op_binary_add` etc., spell their operator
+# inline). Neither kind checks for int operands first: on CPython 3.11 the
+# call to a C builtin is already specialized, and generating a handler with
+# an inline operator for each of these measured no faster, while a
+# Python-level type guard only adds work to every non-int operation.
+def _binary(fn: Callable[[Any, Any], Any]):
+    def handler(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = fn(stack[-1], b)
+    return handler
+
+
+def _fused_ff(fn: Callable[[Any, Any], Any]):
+    def handler(self, frame: Frame, arg):
+        i, j = arg
+        fast = frame.fastlocals
+        a = fast[i]
+        b = fast[j]
+        if a is _UNBOUND:
+            a = self.lookup(frame, frame.code.varnames[i])
+        if b is _UNBOUND:
+            b = self.lookup(frame, frame.code.varnames[j])
+        frame.stack.append(fn(a, b))
+    return handler
+
+
+def _fused_fc(fn: Callable[[Any, Any], Any]):
+    def handler(self, frame: Frame, arg):
+        i, j = arg
+        a = frame.fastlocals[i]
+        if a is _UNBOUND:
+            a = self.lookup(frame, frame.code.varnames[i])
+        frame.stack.append(fn(a, frame.code.consts[j]))
+    return handler
+
+
 class VM:
-    def __init__(self, builtins: Dict[str, Any] | None = None):
-        # Lazy import runtime to avoid circular imports at module load time
-        try:
-            from . import runtime as _runtime
-        except Exception:
-            _runtime = None
+    # Number of calls after which a function's CodeObject is promoted (see
+    # `promote`).
+    HOT_THRESHOLD = 16
 
+    def __init__(self, builtins: Dict[str, Any] | None = None, profile: bool = False):
         self.frames: List[Frame] = []
-        # Default builtins from runtime if available
-        default_builtins: Dict[str, Any] = {}
-        if _runtime is not None:
-            default_builtins = {"দেখাও": _runtime.bpl_print, "প্রকার": _runtime.bpl_type}
+        # Share the default builtins unless the caller overrides some; a
+        # merged copy is made only then. Treat `self.builtins` as read-only.
+        if builtins:
+            self.builtins = {**_DEFAULT_BUILTINS, **builtins}
+        else:
+            self.builtins = _DEFAULT_BUILTINS
+        self._epoch = next(_EPOCHS)
 
-        # Merge provided builtins over defaults
-        self.builtins = {**default_builtins, **(builtins or {})}
+        # Profiling swaps in an instance-level dispatch table whose handlers
+        # count each executed opcode, so the normal path pays nothing.
+        self.profile = profile
+        self.opcode_counts: Counter = Counter()
+        if profile:
+            self.DISPATCH = [
+                None if h is None else _counting(h, op, self.opcode_counts)
+                for op, h in enumerate(VM.DISPATCH)
+            ]
 
     def run_code(self, code: CodeObject, globals_: Dict[str, Any] | None = None, locals_: Dict[str, Any] | None = None):
-        globals_ = globals_ or {}
-        locals_ = locals_ or {}
+        if globals_ is None:
+            globals_ = {}
+        # As in Python, module-level code uses its globals as its locals, so
+        # functions it defines can see each other (and themselves).
+        if locals_ is None:
+            locals_ = globals_
+        # The namespaces may have been changed from outside the VM
+        self._epoch = next(_EPOCHS)
         frame = Frame(code, globals_, locals_)
         self.frames.append(frame)
         try:
             return self.run_frame(frame)
+        except (ArithmeticError, TypeError) as e:
+            # Operators and generated code raise Python's own errors; report
+            # them as the evaluator does
+            raise VMError(f"টাইপ ত্রুটি: {e}") from e
         finally:
             self.frames.pop()
 
+    def profile_report(self) -> List[Tuple[str, int]]:
+        """Executed opcodes by name, most frequent first (profile mode)."""
+        return [(OPNAMES[op], n) for op, n in self.opcode_counts.most_common()]
+
+    def thread(self, code: CodeObject) -> List[Any]:
+        """Resolve every opcode of `code` to its handler ahead of time.
+
+        This is direct threading: `run_frame` calls the next handler straight
+        from the list, with no per-instruction dispatch table lookup or
+        opcode range check. It is built the first time the code runs, and
+        rebuilt if a VM with a different table (profiling) runs it.
+        """
+        dispatch = self.DISPATCH
+        threaded = []
+        for op in code.ops:
+            handler = dispatch[op] if op < len(dispatch) else None
+            if handler is None:
+                raise VMError(f"Unknown opcode: {op}")
+            threaded.append(handler)
+        code.threaded = threaded
+        code.threaded_by = dispatch
+        return threaded
+
+    def promote(self, code: CodeObject) -> None:
+        """Give a hot function a straight-line Python translation.
+
+        Code the compiler can translate to a plain Python function gets
+        `code.pyfunc`, which bypasses the interpreter loop entirely.
+        """
+        # Lazy import: the compiler module imports this one
+        from .compiler import Compiler
+
+        # Generated functions do not go through dispatch, so they would
+        # hide their opcodes from the profile.
+        if not self.profile:
+            code.pyfunc = Compiler.to_python_function(code)
+
     def run_frame(self, frame: Frame):
+        # Hot attributes are bound to locals once; the program counter lives
+        # in a local and is written back to the frame only on exit.
+        code = frame.code
+        threaded = code.threaded
+        if threaded is None or code.threaded_by is not self.DISPATCH:
+            threaded = self.thread(code)
         stack = frame.stack
-        instrs = frame.code.instructions
-        consts = frame.code.consts
-        names = frame.code.names
-
-        while frame.pc < len(instrs):
-            ins = instrs[frame.pc]
-            frame.pc += 1
-            op = ins.op
-            arg = ins.arg
-
-            if op == LOAD_CONST:
-                stack.append(consts[arg])
-                continue
-
-            if op == LOAD_NAME:
-                name = names[arg]
-                if name in frame.locals:
-                    stack.append(frame.locals[name])
-                elif name in frame.globals:
-                    stack.append(frame.globals[name])
-                elif name in self.builtins:
-                    stack.append(self.builtins[name])
-                else:
-                    raise VMError(f"NameError: {name}")
-                continue
-
-            if op == STORE_NAME:
-                name = names[arg]
-                val = stack.pop()
-                frame.locals[name] = val
-                continue
-
-            if op == POP_TOP:
-                stack.pop()
-                continue
-
-            if op in (BINARY_ADD, BINARY_SUB, BINARY_MUL, BINARY_DIV):
-                b = stack.pop()
-                a = stack.pop()
-                if op == BINARY_ADD:
-                    stack.append(a + b)
-                elif op == BINARY_SUB:
-                    stack.append(a - b)
-                elif op == BINARY_MUL:
-                    stack.append(a * b)
-                elif op == BINARY_DIV:
-                    stack.append(a / b)
-                continue
-
-            if op == CALL_FUNCTION:
-                argcount = arg
-                args = [stack.pop() for _ in range(argcount)][::-1]
-                func = stack.pop()
-                # If func is a CodeObject (user-defined), create a new frame
-                if isinstance(func, CodeObject):
-                    # Prepare globals for function as a shallow copy of caller globals
-                    new_globals = dict(frame.globals)
-                    # Prepare locals with parameters already bound by compiler
-                    fn_locals: Dict[str, Any] = {}
-                    # The compiler stores parameter names in func.names (positional at start)
-                    for i, v in enumerate(args[: func.argcount]):
-                        if i < len(func.names):
-                            param = func.names[i]
-                            fn_locals[param] = v
-
-                    res = self.run_code(func, new_globals, fn_locals)
-                    stack.append(res)
-                elif callable(func):
-                    # Builtin Python callable
-                    res = func(*args)
-                    stack.append(res)
-                else:
-                    raise VMError("Attempt to call non-callable")
-                continue
-
-            if op == RETURN_VALUE:
-                val = stack.pop() if stack else None
-                return val
-
-            raise VMError(f"Unknown opcode: {op}")
+        args = code.args
+        n = len(threaded)
+        pc = frame.pc
+
+        try:
+            while pc < n:
+                handler = threaded[pc]
+                arg = args[pc]
+                pc += 1
+                res = handler(self, frame, arg)
+                if res is not None:
+                    if res is _RETURN:
+                        return stack.pop() if stack else None
+                    pc = frame.pc
+        finally:
+            frame.pc = pc
 
         return None
+
+    # Opcode handlers. Each takes (frame, arg) and returns None, the
+    # `_RETURN` sentinel to make `run_frame` leave the current frame, or
+    # `_JUMP` after setting `frame.pc` to the jump target.
+
+    def _op_load_const(self, frame: Frame, arg):
+        frame.stack.append(frame.code.consts[arg])
+
+    def _op_load_name(self, frame: Frame, arg):
+        # The cache holds the dict the name was found in, not its value, so
+        # rebinding an existing name leaves it valid. STORE_NAME moves the
+        # VM to a new epoch only when it adds a name, which may shadow the
+        # cached tier, or changes the type bound to one, which may change
+        # whether a callee is a function (see `_op_store_name`).
+        cache = frame.code.name_cache
+        entry = cache[arg]
+        if entry is not None and entry[0] == self._epoch:
+            frame.stack.append(entry[1][entry[2]])
+            return
+        name = frame.code.names[arg]
+        if name in frame.locals:
+            scope = frame.locals
+        elif name in frame.globals:
+            scope = frame.globals
+        elif name in self.builtins:
+            scope = self.builtins
+        elif arg in frame.code.callees:
+            frame.stack.append(_Uncallable(name))
+            return
+        else:
+            raise VMError(f"নাম ত্রুটি: অপরিচিত নাম '{name}'")
+        val = scope[name]
+        if arg in frame.code.callees:
+            val = _as_callee(val, name)
+            if type(val) is _Uncallable:
+                frame.stack.append(val)
+                return
+        cache[arg] = (self._epoch, scope, name)
+        frame.stack.append(val)
+
+    def _op_store_name(self, frame: Frame, arg):
+        locs = frame.locals
+        name = frame.code.names[arg]
+        val = frame.stack.pop()
+        # A new name has type(_UNBOUND), which no value has
+        if type(locs.get(name, _UNBOUND)) is not type(val):
+            self._epoch = next(_EPOCHS)
+        locs[name] = val
+
+    def _op_load_fast(self, frame: Frame, arg):
+        val = frame.fastlocals[arg]
+        if val is _UNBOUND:
+            # Not assigned yet in this call: like the evaluator, read the
+            # name from the enclosing scopes instead
+            val = self.lookup(frame, frame.code.varnames[arg])
+        frame.stack.append(val)
+
+    def _op_store_fast(self, frame: Frame, arg):
+        frame.fastlocals[arg] = frame.stack.pop()
+
+    def _op_pop_top(self, frame: Frame, arg):
+        frame.stack.pop()
+
+    def _op_binary_add(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = stack[-1] + b
+
+    def _op_binary_sub(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = stack[-1] - b
+
+    def _op_binary_mul(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = stack[-1] * b
+
+    def _op_binary_div(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = stack[-1] / b
+
+    def _op_call_function(self, frame: Frame, arg):
+        stack = frame.stack
+        if arg:
+            args = stack[-arg:]
+            del stack[-arg:]
+        else:
+            args = ()
+        func = stack.pop()
+        if callable(func):
+            # Builtin Python callable (a CodeObject is not callable itself)
+            stack.append(func(*args))
+        else:
+            stack.append(self.call_object(func, args, frame.globals))
+
+    def _op_call_return(self, frame: Frame, arg):
+        # CALL_FUNCTION then RETURN_VALUE, in a single dispatch
+        stack = frame.stack
+        if arg:
+            args = stack[-arg:]
+            del stack[-arg:]
+        else:
+            args = ()
+        func = stack.pop()
+        if callable(func):
+            stack.append(func(*args))
+        else:
+            stack.append(self.call_object(func, args, frame.globals))
+        return _RETURN
+
+    def _op_make_function(self, frame: Frame, arg):
+        stack = frame.stack
+        stack[-1] = Closure(stack[-1], (frame.fastlocals, frame.code.varnames, frame.scope))
+
+    def _op_load_free(self, frame: Frame, arg):
+        name = frame.code.names[arg]
+        if arg not in frame.code.callees:
+            frame.stack.append(self.lookup(frame, name))
+            return
+        try:
+            val = _as_callee(self.lookup(frame, name), name)
+        except VMError:
+            val = _Uncallable(name)
+        frame.stack.append(val)
+
+    def lookup(self, frame: Frame, name: str):
+        """Resolve `name` through the frame's own fast locals, the enclosing
+        functions' (innermost first), then globals and builtins.
+
+        Slots that are not assigned yet are skipped, matching the
+        evaluator's environment chain.
+        """
+        fast, varnames, scope = frame.fastlocals, frame.code.varnames, frame.scope
+        while True:
+            if name in varnames:
+                val = fast[varnames.index(name)]
+                if val is not _UNBOUND:
+                    return val
+            if scope is None:
+                return self.load_global(frame.globals, name)
+            fast, varnames, scope = scope
+
+    def call_object(self, func: Any, args: Sequence[Any], globals_: Dict[str, Any]):
+        """Call a user-defined CodeObject or Closure, or a builtin Python callable."""
+        scope = None
+        if type(func) is Closure:
+            scope = func.scope
+            func = func.code
+        # If func is a CodeObject (user-defined), create a new frame
+        if isinstance(func, CodeObject):
+            func.calls += 1
+            if func.calls == self.HOT_THRESHOLD:
+                self.promote(func)
+            nparams = func.argcount
+            if len(args) != nparams:
+                raise VMError(f"রানটাইম ত্রুটি: {func.name} প্রত্যাশা {nparams} আর্গুমেন্ট কিন্তু পেয়েছে {len(args)}")
+            # Functions share the caller's globals dict, as in Python.
+            # Generated code runs no opcodes, so a profiling VM ignores it
+            # even when another VM has already promoted the function.
+            if func.pyfunc is not None and not self.profile:
+                return func.pyfunc(self, globals_, *args)
+            # Parameters occupy the first fast local slots. Every other name
+            # a function binds is a fast local too, so it needs no locals
+            # dict of its own: LOAD_NAME resolves through the globals.
+            fastlocals = list(args)
+            fastlocals += [_UNBOUND] * (len(func.varnames) - nparams)
+            new_frame = Frame(func, globals_, globals_, fastlocals, scope)
+            self.frames.append(new_frame)
+            try:
+                return self.run_frame(new_frame)
+            finally:
+                self.frames.pop()
+        if callable(func):
+            # Builtin Python callable
+            return func(*args)
+        name = func.name if type(func) is _Uncallable else func
+        raise VMError(f"নাম ত্রুটি: অপরিচিত ফাংশন '{name}'")
+
+    def load_global(self, globals_: Dict[str, Any], name: str, callee: bool = False):
+        """Resolve `name` in globals, then builtins (used by generated code).
+
+        With `callee`, a name that is unbound or not a function loads as a
+        stand-in that `call_object` reports as an unknown function.
+        """
+        if name in globals_:
+            val = globals_[name]
+        elif name in self.builtins:
+            val = self.builtins[name]
+        elif callee:
+            return _Uncallable(name)
+        else:
+            raise VMError(f"নাম ত্রুটি: অপরিচিত নাম '{name}'")
+        return _as_callee(val, name) if callee else val
+
+    def _op_return_value(self, frame: Frame, arg):
+        return _RETURN
+
+    def _op_return_const(self, frame: Frame, arg):
+        frame.stack.append(frame.code.consts[arg])
+        return _RETURN
+
+    def _op_logical_and(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = bool(stack[-1]) and bool(b)
+
+    def _op_logical_or(self, frame: Frame, arg):
+        stack = frame.stack
+        b = stack.pop()
+        stack[-1] = bool(stack[-1]) or bool(b)
+
+    def _op_unary_not(self, frame: Frame, arg):
+        stack = frame.stack
+        stack[-1] = not stack[-1]
+
+    def _op_jump_absolute(self, frame: Frame, arg):
+        frame.pc = arg
+        return _JUMP
+
+    def _op_pop_jump_if_false(self, frame: Frame, arg):
+        if not frame.stack.pop():
+            frame.pc = arg
+            return _JUMP
+
+    DISPATCH: List[Any] = [None] * len(OPNAMES)
+    DISPATCH[LOAD_CONST] = _op_load_const
+    DISPATCH[LOAD_NAME] = _op_load_name
+    DISPATCH[STORE_NAME] = _op_store_name
+    DISPATCH[POP_TOP] = _op_pop_top
+    DISPATCH[BINARY_ADD] = _op_binary_add
+    DISPATCH[BINARY_SUB] = _op_binary_sub
+    DISPATCH[BINARY_MUL] = _op_binary_mul
+    DISPATCH[BINARY_DIV] = _op_binary_div
+    DISPATCH[CALL_FUNCTION] = _op_call_function
+    DISPATCH[RETURN_VALUE] = _op_return_value
+    DISPATCH[LOAD_FAST] = _op_load_fast
+    DISPATCH[STORE_FAST] = _op_store_fast
+    DISPATCH[FAST_ADD_FF] = _fused_ff(operator.add)
+    DISPATCH[FAST_ADD_FC] = _fused_fc(operator.add)
+    DISPATCH[FAST_SUB_FF] = _fused_ff(operator.sub)
+    DISPATCH[FAST_SUB_FC] = _fused_fc(operator.sub)
+    DISPATCH[FAST_MUL_FF] = _fused_ff(operator.mul)
+    DISPATCH[FAST_MUL_FC] = _fused_fc(operator.mul)
+    DISPATCH[FAST_DIV_FF] = _fused_ff(operator.truediv)
+    DISPATCH[FAST_DIV_FC] = _fused_fc(operator.truediv)
+    DISPATCH[BINARY_MOD] = _binary(operator.mod)
+    DISPATCH[COMPARE_EQ] = _binary(operator.eq)
+    DISPATCH[COMPARE_NE] = _binary(operator.ne)
+    DISPATCH[COMPARE_LT] = _binary(operator.lt)
+    DISPATCH[COMPARE_GT] = _binary(operator.gt)
+    DISPATCH[COMPARE_LE] = _binary(operator.le)
+    DISPATCH[COMPARE_GE] = _binary(operator.ge)
+    DISPATCH[LOGICAL_AND] = _op_logical_and
+    DISPATCH[LOGICAL_OR] = _op_logical_or
+    DISPATCH[UNARY_NOT] = _op_unary_not
+    DISPATCH[JUMP_ABSOLUTE] = _op_jump_absolute
+    DISPATCH[POP_JUMP_IF_FALSE] = _op_pop_jump_if_false
+    DISPATCH[RETURN_CONST] = _op_return_const
+    DISPATCH[CALL_RETURN] = _op_call_return
+    DISPATCH[MAKE_FUNCTION] = _op_make_function
+    DISPATCH[LOAD_FREE] = _op_load_free
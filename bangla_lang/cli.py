@@ -1,26 +1,49 @@
 """Simple CLI runner for BPL files."""
+from __future__ import annotations
+
 from pathlib import Path
 import sys
 
 from .lexer import lex
 from .parser import parse_tokens
-from .evaluator import run_program
+from .compiler import Compiler
+from .bytecode import VM
+from ._cache import cached_compile
 
 
-def run_source(source: str, filename: str = "<input>"):
+def run_source(source: str, filename: str = "<input>", vm: VM | None = None):
     tokens = lex(source)
     ast = parse_tokens(tokens)
-    return run_program(ast)
+    return run_ast(ast, vm)
+
 
+def run_ast(ast, vm: VM | None = None):
+    code = Compiler().compile(ast)
+    return (vm or VM()).run_code(code)
 
-def run_file(path: str):
+
+def run_file(path: str, vm: VM | None = None):
     p = Path(path)
     src = p.read_text(encoding="utf-8")
-    return run_source(src, str(p))
+    # Files are usually run unchanged many times; reuse their compiled code
+    return (vm or VM()).run_code(cached_compile(src))
 
 
-if __name__ == "__main__":
-    if len(sys.argv) <= 1:
-        print("ব্যবহার: python -m bangla_lang.cli <file.bang>")
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+    profile = "--profile" in args
+    if profile:
+        args.remove("--profile")
+    if not args:
+        print("ব্যবহার: python -m bangla_lang.cli [--profile] <file.bang>")
         sys.exit(1)
-    run_file(sys.argv[1])
+    vm = VM(profile=profile)
+    run_file(args[0], vm)
+    if profile:
+        # Opcode frequencies, hottest first
+        for name, count in vm.profile_report():
+            print(f"{count:>10}  {name}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
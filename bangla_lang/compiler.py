@@ -5,10 +5,12 @@ Call, FunctionDef. Produces a `CodeObject` consumed by `bytecode.VM`.
 """
 from __future__ import annotations
 
-from typing import Any, List, Dict
+import math
+import operator
+from array import array
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from .ast import *
 from .bytecode import (
-    Instruction,
     CodeObject,
     LOAD_CONST,
     LOAD_NAME,
@@ -20,6 +22,34 @@ from .bytecode import (
     BINARY_DIV,
     RETURN_VALUE,
     CALL_FUNCTION,
+    LOAD_FAST,
+    STORE_FAST,
+    FUSED_BINARY,
+    FAST_ADD_FF,
+    FAST_ADD_FC,
+    FAST_SUB_FF,
+    FAST_SUB_FC,
+    FAST_MUL_FF,
+    FAST_MUL_FC,
+    FAST_DIV_FF,
+    FAST_DIV_FC,
+    BINARY_MOD,
+    COMPARE_EQ,
+    COMPARE_NE,
+    COMPARE_LT,
+    COMPARE_GT,
+    COMPARE_LE,
+    COMPARE_GE,
+    LOGICAL_AND,
+    LOGICAL_OR,
+    UNARY_NOT,
+    JUMP_ABSOLUTE,
+    POP_JUMP_IF_FALSE,
+    JUMP_OPS,
+    RETURN_CONST,
+    CALL_RETURN,
+    MAKE_FUNCTION,
+    LOAD_FREE,
 )
 
 
@@ -27,45 +57,402 @@ class CompileError(Exception):
     pass
 
 
+def _collect_locals(body: List[Any], out: List[str]) -> None:
+    """Append names bound by statements in `body` (not nested functions) to `out`."""
+    for stmt in body or []:
+        if isinstance(stmt, Assign) and isinstance(stmt.target, Identifier):
+            name = stmt.target.name
+        elif isinstance(stmt, FunctionDef):
+            name = stmt.name
+        elif isinstance(stmt, If):
+            _collect_locals(stmt.body, out)
+            _collect_locals(stmt.orelse, out)
+            continue
+        elif isinstance(stmt, While):
+            _collect_locals(stmt.body, out)
+            continue
+        else:
+            continue
+        if name not in out:
+            out.append(name)
+
+
+# BPL binary operator -> opcode
+_BINARY_OPCODES = {
+    "+": BINARY_ADD,
+    "-": BINARY_SUB,
+    "*": BINARY_MUL,
+    "/": BINARY_DIV,
+    "%": BINARY_MOD,
+    "==": COMPARE_EQ,
+    "!=": COMPARE_NE,
+    "<": COMPARE_LT,
+    ">": COMPARE_GT,
+    "<=": COMPARE_LE,
+    ">=": COMPARE_GE,
+    "এবং": LOGICAL_AND,
+    "বা": LOGICAL_OR,
+}
+
+# Python operator for each binary opcode, used by `Compiler.to_python_source`
+_PY_BINOPS = {
+    BINARY_ADD: "+", FAST_ADD_FF: "+", FAST_ADD_FC: "+",
+    BINARY_SUB: "-", FAST_SUB_FF: "-", FAST_SUB_FC: "-",
+    BINARY_MUL: "*", FAST_MUL_FF: "*", FAST_MUL_FC: "*",
+    BINARY_DIV: "/", FAST_DIV_FF: "/", FAST_DIV_FC: "/",
+    BINARY_MOD: "%",
+    COMPARE_EQ: "==", COMPARE_NE: "!=",
+    COMPARE_LT: "<", COMPARE_GT: ">",
+    COMPARE_LE: "<=", COMPARE_GE: ">=",
+}
+
+_FUSED_OPS = {op for pair in FUSED_BINARY.values() for op in pair}
+
+# Binary opcode -> function with the VM's semantics, for constant folding
+_FOLD_BINOPS: Dict[int, Callable[[Any, Any], Any]] = {
+    BINARY_ADD: operator.add,
+    BINARY_SUB: operator.sub,
+    BINARY_MUL: operator.mul,
+    BINARY_DIV: operator.truediv,
+    BINARY_MOD: operator.mod,
+    COMPARE_EQ: operator.eq,
+    COMPARE_NE: operator.ne,
+    COMPARE_LT: operator.lt,
+    COMPARE_GT: operator.gt,
+    COMPARE_LE: operator.le,
+    COMPARE_GE: operator.ge,
+    LOGICAL_AND: lambda a, b: bool(a) and bool(b),
+    LOGICAL_OR: lambda a, b: bool(a) or bool(b),
+}
+
+# Instructions after which execution never falls through to the next one
+_TERMINATORS = frozenset((RETURN_VALUE, RETURN_CONST, CALL_RETURN, JUMP_ABSOLUTE))
+
+# Constant types that can be written into generated source via repr()
+_LITERAL_TYPES = (int, float, str, bool, type(None))
+
+# Ints beyond this are read from `_c` rather than inlined: their repr can
+# exceed the int -> str digit limit
+_MAX_INLINE_INT = 2 ** 63
+
+# Marks an operand that is not a compile-time constant
+_NOT_CONST = object()
+
+# Folded strings longer than this are left to be built at run time
+_MAX_FOLDED_STR = 4096
+
+
+def _fold(opcode: int, left: Any, right: Any) -> Any:
+    """Evaluate a binary op on two constants, or return `_NOT_CONST` when it
+    must stay a run-time operation (it raises, or builds a huge string)."""
+    if opcode == BINARY_MUL and (type(left) is str or type(right) is str):
+        count = right if type(left) is str else left
+        if type(count) is int and count > _MAX_FOLDED_STR:
+            return _NOT_CONST
+    try:
+        value = _FOLD_BINOPS[opcode](left, right)
+    except Exception:
+        return _NOT_CONST
+    if type(value) is str and len(value) > _MAX_FOLDED_STR:
+        return _NOT_CONST
+    return value
+
+
 class Compiler:
-    def __init__(self):
-        self.instructions: List[Instruction] = []
+    def __init__(self, varnames: List[str] | None = None, enclosed: bool = False):
+        self.ops = array("B")
+        self.args: List[Any] = []
         self.consts: List[Any] = []
         self.names: List[str] = []
+        self._const_index: Dict[Tuple[Any, Any], int] = {}
+        self._name_index: Dict[str, int] = {}
+        # Callee names get entries of their own (see `CodeObject.callees`)
+        self._callee_index: Dict[str, int] = {}
         self.argcount = 0
+        # Function-local names resolved to fast slots; empty at module level
+        self.varnames: List[str] = list(varnames or [])
+        self._fast_index: Dict[str, int] = {n: i for i, n in enumerate(self.varnames)}
+        # Compiling a function body (`varnames` given); and one nested in
+        # another function, whose other names may be the enclosing one's
+        self.in_function = varnames is not None
+        self.enclosed = enclosed
 
     def add_const(self, value: Any) -> int:
-        try:
-            idx = self.consts.index(value)
-        except ValueError:
+        # Key by type as well as value so that e.g. True, 1 and 1.0 stay
+        # distinct, and floats by sign too, since 0.0 == -0.0; other objects
+        # (function code) are keyed by identity.
+        if type(value) is float:
+            key: Tuple[Any, ...] = (float, value, math.copysign(1.0, value))
+        elif isinstance(value, _LITERAL_TYPES):
+            key = (type(value), value)
+        else:
+            key = ("id", id(value))
+        idx = self._const_index.get(key)
+        if idx is None:
             idx = len(self.consts)
             self.consts.append(value)
+            self._const_index[key] = idx
         return idx
 
-    def add_name(self, name: str) -> int:
-        try:
-            idx = self.names.index(name)
-        except ValueError:
+    def add_name(self, name: str, callee: bool = False) -> int:
+        index = self._callee_index if callee else self._name_index
+        idx = index.get(name)
+        if idx is None:
             idx = len(self.names)
             self.names.append(name)
+            index[name] = idx
         return idx
 
-    def emit(self, op: str, arg: Any = None) -> None:
-        self.instructions.append(Instruction(op, arg))
+    def emit_load(self, name: str, callee: bool = False) -> None:
+        idx = self._fast_index.get(name)
+        if idx is not None and not callee:
+            self.emit(LOAD_FAST, idx)
+        elif idx is not None or self.enclosed:
+            # A local callee goes through LOAD_FREE, which checks callees
+            self.emit(LOAD_FREE, self.add_name(name, callee))
+        else:
+            self.emit(LOAD_NAME, self.add_name(name, callee))
+
+    def emit_store(self, name: str) -> None:
+        idx = self._fast_index.get(name)
+        if idx is not None:
+            self.emit(STORE_FAST, idx)
+        else:
+            self.emit(STORE_NAME, self.add_name(name))
+
+    def emit(self, op: int, arg: Any = None) -> None:
+        self.ops.append(op)
+        self.args.append(arg)
+
+    def emit_jump(self, op: int) -> int:
+        """Emit a jump with a placeholder target; returns its index for `patch_jump`."""
+        self.emit(op, None)
+        return len(self.ops) - 1
+
+    def patch_jump(self, idx: int) -> None:
+        """Point the jump at `idx` to the next instruction to be emitted."""
+        self.args[idx] = len(self.ops)
+
+    def peephole(self) -> None:
+        """Rewrite common instruction sequences into shorter ones.
+
+        - LOAD_FAST; LOAD_FAST|LOAD_CONST; BINARY_<op> -> one super-instruction
+        - LOAD_CONST i; RETURN_VALUE -> RETURN_CONST i
+        - CALL_FUNCTION n; RETURN_VALUE -> CALL_RETURN n
+        - LOAD_CONST; POP_TOP -> nothing (constants have no side effects)
+        - unreachable instructions, such as the implicit return after a
+          function's last `ফলাফল` -> nothing
+
+        A sequence is only rewritten when no jump lands inside it; jump
+        targets are remapped to the rewritten instruction indices.
+        """
+        ops, args = self.ops, self.args
+        n = len(ops)
+        live = self._reachable()
+        targets = {args[k] for k in range(n) if live[k] and ops[k] in JUMP_OPS}
+        new_index = [0] * (n + 1)
+        new_ops = array("B")
+        new_args: List[Any] = []
+        i = 0
+        while i < n:
+            op = ops[i]
+            new_index[i] = len(new_ops)
+            if not live[i]:
+                i += 1
+                continue
+            if (
+                i + 2 < n and op == LOAD_FAST and ops[i + 2] in FUSED_BINARY
+                and ops[i + 1] in (LOAD_FAST, LOAD_CONST)
+                and i + 1 not in targets and i + 2 not in targets
+            ):
+                ff, fc = FUSED_BINARY[ops[i + 2]]
+                new_ops.append(ff if ops[i + 1] == LOAD_FAST else fc)
+                new_args.append((args[i], args[i + 1]))
+                new_index[i + 1] = new_index[i + 2] = new_index[i]
+                i += 3
+                continue
+            if op == LOAD_CONST and i + 1 < n and i + 1 not in targets:
+                if ops[i + 1] == RETURN_VALUE:
+                    new_ops.append(RETURN_CONST)
+                    new_args.append(args[i])
+                    new_index[i + 1] = new_index[i]
+                    i += 2
+                    continue
+                if ops[i + 1] == POP_TOP:
+                    new_index[i + 1] = new_index[i]
+                    i += 2
+                    continue
+            if (
+                op == CALL_FUNCTION and i + 1 < n and ops[i + 1] == RETURN_VALUE
+                and i + 1 not in targets
+            ):
+                new_ops.append(CALL_RETURN)
+                new_args.append(args[i])
+                new_index[i + 1] = new_index[i]
+                i += 2
+                continue
+            new_ops.append(op)
+            new_args.append(args[i])
+            i += 1
+        new_index[n] = len(new_ops)
+        for k, op in enumerate(new_ops):
+            if op in JUMP_OPS:
+                new_args[k] = new_index[new_args[k]]
+        self.ops, self.args = new_ops, new_args
+
+    def _reachable(self) -> bytearray:
+        """Flag, per instruction, whether any path from the entry reaches it."""
+        ops, args = self.ops, self.args
+        n = len(ops)
+        live = bytearray(n)
+        todo = [0]
+        while todo:
+            pc = todo.pop()
+            while pc < n and not live[pc]:
+                live[pc] = 1
+                op = ops[pc]
+                if op in JUMP_OPS:
+                    todo.append(args[pc])
+                if op in _TERMINATORS:
+                    break
+                pc += 1
+        return live
+
+    @staticmethod
+    def to_python_source(code: CodeObject) -> Optional[str]:
+        """Translate a function CodeObject into the source of a Python function.
+
+        The generated `__bpl_fn(_vm, _g, <params>)` evaluates the same
+        operations with a compile-time stack of expression strings, so the
+        result runs on CPython's own interpreter with no VM dispatch.
+        Non-literal constants are read from `_c`, global/builtin names
+        through `_vm.load_global`, and calls go through `_vm.call_object`.
+
+        Returns None when the code cannot be translated faithfully (it
+        reads a local before assigning it, or uses an unsupported opcode
+        such as a jump).
+        """
+        consts = code.consts
+        nparams = code.argcount
+        assigned = set(range(nparams))
+        body: List[str] = []
+        stack: List[str] = []
+
+        def const(idx: int) -> str:
+            value = consts[idx]
+            t = type(value)
+            if t is float:
+                # repr(inf) and repr(nan) are not Python expressions
+                inline = math.isfinite(value)
+            elif t is int:
+                inline = -_MAX_INLINE_INT <= value <= _MAX_INLINE_INT
+            else:
+                inline = t in _LITERAL_TYPES
+            return repr(value) if inline else f"_c[{idx}]"
+
+        def fast(idx: int) -> Optional[str]:
+            return f"_v{idx}" if idx in assigned else None
+
+        for op, arg in zip(code.ops, code.args):
+            if op == LOAD_CONST:
+                stack.append(const(arg))
+            elif op == LOAD_FAST:
+                expr = fast(arg)
+                if expr is None:
+                    return None
+                stack.append(expr)
+            elif op == STORE_FAST:
+                body.append(f"_v{arg} = {stack.pop()}")
+                assigned.add(arg)
+            elif op == LOAD_NAME:
+                callee = ", True" if arg in code.callees else ""
+                stack.append(f"_vm.load_global(_g, {code.names[arg]!r}{callee})")
+            elif op == POP_TOP:
+                body.append(stack.pop())
+            elif op in _PY_BINOPS and op not in _FUSED_OPS:
+                b = stack.pop()
+                a = stack.pop()
+                stack.append(f"({a} {_PY_BINOPS[op]} {b})")
+            elif op == LOGICAL_AND or op == LOGICAL_OR:
+                b = stack.pop()
+                a = stack.pop()
+                # `&`/`|` on bools evaluate both operands, as the VM and the
+                # evaluator do; `and`/`or` would skip the right operand.
+                word = "&" if op == LOGICAL_AND else "|"
+                stack.append(f"(bool({a}) {word} bool({b}))")
+            elif op == UNARY_NOT:
+                stack.append(f"(not {stack.pop()})")
+            elif op in (FAST_ADD_FF, FAST_SUB_FF, FAST_MUL_FF, FAST_DIV_FF):
+                a, b = fast(arg[0]), fast(arg[1])
+                if a is None or b is None:
+                    return None
+                stack.append(f"({a} {_PY_BINOPS[op]} {b})")
+            elif op in (FAST_ADD_FC, FAST_SUB_FC, FAST_MUL_FC, FAST_DIV_FC):
+                a = fast(arg[0])
+                if a is None:
+                    return None
+                stack.append(f"({a} {_PY_BINOPS[op]} {const(arg[1])})")
+            elif op == CALL_FUNCTION or op == CALL_RETURN:
+                call_args = stack[len(stack) - arg:]
+                del stack[len(stack) - arg:]
+                func = stack.pop()
+                call = f"_vm.call_object({func}, [{', '.join(call_args)}], _g)"
+                if op == CALL_RETURN:
+                    body.append(f"return {call}")
+                    break
+                stack.append(call)
+            elif op == RETURN_VALUE:
+                body.append(f"return {stack.pop() if stack else 'None'}")
+                break
+            elif op == RETURN_CONST:
+                body.append(f"return {const(arg)}")
+                break
+            else:
+                return None
+            # Statements only occur at stack depth zero; anything else would
+            # need the deferred expressions to be evaluated in order.
+            if op in (STORE_FAST, POP_TOP) and stack:
+                return None
+        else:
+            body.append("return None")
+
+        params = ", ".join(["_vm", "_g"] + [f"_v{i}" for i in range(nparams)])
+        lines = [f"def __bpl_fn({params}):"] + [f"    {line}" for line in body]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def to_python_function(code: CodeObject) -> Optional[Callable[..., Any]]:
+        """Compile `Compiler.to_python_source(code)`; None if untranslatable."""
+        src = Compiler.to_python_source(code)
+        if src is None:
+            return None
+        namespace: Dict[str, Any] = {"_c": code.consts}
+        exec(compile(src, "<bpl-codegen>", "exec"), namespace)
+        return namespace["__bpl_fn"]
+
+    # AST type -> compile_<Type> function, filled in on first use
+    _dispatch: Dict[type, Callable[..., Any]] = {}
 
     def compile(self, node):
-        method = f"compile_{type(node).__name__}"
-        f = getattr(self, method, None)
-        if not f:
-            raise CompileError(f"No compiler for node type {type(node).__name__}")
-        return f(node)
+        t = type(node)
+        f = self._dispatch.get(t)
+        if f is None:
+            f = getattr(type(self), f"compile_{t.__name__}", None)
+            if not f:
+                raise CompileError(f"No compiler for node type {t.__name__}")
+            self._dispatch[t] = f
+        return f(self, node)
 
     def compile_Program(self, node: Program):
         for stmt in node.body or []:
             self.compile(stmt)
         # Ensure a final RETURN_VALUE
         self.emit(RETURN_VALUE)
-        return CodeObject(self.instructions, self.consts, self.names, argcount=0)
+        self.peephole()
+        return CodeObject(
+            bytes(self.ops), tuple(self.args), self.consts, self.names, argcount=0,
+            callees=frozenset(self._callee_index.values()),
+        )
 
     def compile_ExprStmt(self, node: ExprStmt):
         self.compile(node.value)
@@ -76,35 +463,84 @@ class Compiler:
         self.emit(LOAD_CONST, idx)
 
     def compile_Identifier(self, node: Identifier):
-        idx = self.add_name(node.name)
-        self.emit(LOAD_NAME, idx)
+        self.emit_load(node.name)
 
     def compile_Assign(self, node: Assign):
         # Only simple name assignment supported: target is Identifier
         if not isinstance(node.target, Identifier):
             raise CompileError("Only simple identifier assignments supported")
         self.compile(node.value)
-        idx = self.add_name(node.target.name)
-        self.emit(STORE_NAME, idx)
+        self.emit_store(node.target.name)
+
+    def _const_operand(self, start: int) -> Any:
+        """The constant loaded by the single instruction at `start`, if that
+        is all that was emitted since; `_NOT_CONST` otherwise."""
+        if len(self.ops) == start + 1 and self.ops[start] == LOAD_CONST:
+            value = self.consts[self.args[start]]
+            if type(value) in _LITERAL_TYPES:
+                return value
+        return _NOT_CONST
+
+    def _replace_with_const(self, start: int, value: Any) -> None:
+        del self.ops[start:]
+        del self.args[start:]
+        self.emit(LOAD_CONST, self.add_const(value))
 
     def compile_BinaryOp(self, node: BinaryOp):
+        opcode = _BINARY_OPCODES.get(node.op)
+        start = len(self.ops)
         self.compile(node.left)
+        left = self._const_operand(start)
+        mid = len(self.ops)
         self.compile(node.right)
-        op = node.op
-        if op == "+":
-            self.emit(BINARY_ADD)
-        elif op == "-":
-            self.emit(BINARY_SUB)
-        elif op == "*":
-            self.emit(BINARY_MUL)
-        elif op == "/":
-            self.emit(BINARY_DIV)
+        if opcode is None:
+            raise CompileError(f"Unsupported binary op: {node.op}")
+        if left is not _NOT_CONST:
+            right = self._const_operand(mid)
+            if right is not _NOT_CONST:
+                value = _fold(opcode, left, right)
+                if value is not _NOT_CONST:
+                    self._replace_with_const(start, value)
+                    return
+        self.emit(opcode)
+
+    def compile_UnaryOp(self, node: UnaryOp):
+        if node.op != "না":
+            raise CompileError(f"Unsupported unary op: {node.op}")
+        start = len(self.ops)
+        self.compile(node.operand)
+        operand = self._const_operand(start)
+        if operand is not _NOT_CONST:
+            self._replace_with_const(start, not operand)
+            return
+        self.emit(UNARY_NOT)
+
+    def compile_If(self, node: If):
+        self.compile(node.test)
+        jump_else = self.emit_jump(POP_JUMP_IF_FALSE)
+        for stmt in node.body or []:
+            self.compile(stmt)
+        if node.orelse:
+            jump_end = self.emit_jump(JUMP_ABSOLUTE)
+            self.patch_jump(jump_else)
+            for stmt in node.orelse:
+                self.compile(stmt)
+            self.patch_jump(jump_end)
         else:
-            raise CompileError(f"Unsupported binary op: {op}")
+            self.patch_jump(jump_else)
+
+    def compile_While(self, node: While):
+        top = len(self.ops)
+        self.compile(node.test)
+        jump_end = self.emit_jump(POP_JUMP_IF_FALSE)
+        for stmt in node.body or []:
+            self.compile(stmt)
+        self.emit(JUMP_ABSOLUTE, top)
+        self.patch_jump(jump_end)
 
     def compile_Call(self, node: Call):
         # Compile function expression then args
-        self.compile(node.func)
+        self.emit_load(node.func.name, callee=True)
         for arg in node.args or []:
             self.compile(arg)
         self.emit(CALL_FUNCTION, len(node.args or []))
@@ -119,16 +555,22 @@ class Compiler:
         self.emit(RETURN_VALUE)
 
     def compile_FunctionDef(self, node: FunctionDef):
-        # Compile function body into a nested CodeObject
-        comp = Compiler()
-        # record argument names in names list positionally
-        for p in node.params or []:
-            comp.add_name(p)
+        # Compile function body into a nested CodeObject. Parameters and
+        # names assigned in the body become fast locals.
+        varnames = list(node.params or [])
+        _collect_locals(node.body, varnames)
+        comp = Compiler(varnames, enclosed=self.in_function)
         for stmt in node.body or []:
             comp.compile(stmt)
         comp.emit(RETURN_VALUE)
-        func_code = CodeObject(comp.instructions, comp.consts, comp.names, argcount=len(node.params or []))
+        comp.peephole()
+        func_code = CodeObject(
+            bytes(comp.ops), tuple(comp.args), comp.consts, comp.names,
+            argcount=len(node.params or []), varnames=comp.varnames,
+            name=node.name, callees=frozenset(comp._callee_index.values()),
+        )
         const_idx = self.add_const(func_code)
         self.emit(LOAD_CONST, const_idx)
-        name_idx = self.add_name(node.name)
-        self.emit(STORE_NAME, name_idx)
+        if self.in_function:
+            self.emit(MAKE_FUNCTION)
+        self.emit_store(node.name)
@@ -2,6 +2,7 @@
 
 Contains an `Environment` class and minimal evaluator functions to be extended.
 """
+import operator
 from typing import Any, Dict, Optional
 
 from .errors import RuntimeErrorBPL
@@ -9,6 +10,22 @@ from .ast import Program, ExprStmt, Assign, Identifier, Literal, BinaryOp, Unary
 from .runtime import bpl_print, bpl_type
 
 
+# Arithmetic and comparison operators as C-level functions
+_BINOPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
 class ReturnException(Exception):
     def __init__(self, value: Any):
         self.value = value
@@ -80,106 +97,122 @@ class Evaluator:
         raise RuntimeErrorBPL("রানটাইম ত্রুটি: অনির্ণীত নোড")
 
     def eval_statement(self, stmt, env: Environment):
-        if isinstance(stmt, ExprStmt):
-            return self.eval_expression(stmt.value, env)
-        if isinstance(stmt, Assign):
+        handler = self._stmt_tab.get(type(stmt))
+        if handler is None:
+            raise RuntimeErrorBPL(f"রানটাইম ত্রুটি: অপরিচিত স্টেটমেন্ট {type(stmt)}")
+        return handler(self, stmt, env)
+
+    def _s_expr(self, stmt: ExprStmt, env: Environment):
+        return self.eval_expression(stmt.value, env)
+
+    def _s_assign(self, stmt: Assign, env: Environment):
+        val = self.eval_expression(stmt.value, env)
+        if isinstance(stmt.target, Identifier):
+            env.define(stmt.target.name, val)
+            return val
+        raise RuntimeErrorBPL("সিনট্যাক্স ত্রুটি: অপর্যাপ্ত অ্যাসাইনউপাদান")
+
+    def _s_funcdef(self, stmt: FunctionDef, env: Environment):
+        fn = Function(stmt.name, stmt.params or [], stmt.body or [], env)
+        env.define(stmt.name, fn)
+        return None
+
+    def _s_if(self, stmt: If, env: Environment):
+        cond = self.eval_expression(stmt.test, env)
+        if self.is_truthy(cond):
+            for s in stmt.body:
+                self.eval_statement(s, env)
+        else:
+            for s in stmt.orelse or []:
+                self.eval_statement(s, env)
+        return None
+
+    def _s_while(self, stmt: While, env: Environment):
+        while self.is_truthy(self.eval_expression(stmt.test, env)):
+            for s in stmt.body:
+                self.eval_statement(s, env)
+        return None
+
+    def _s_return(self, stmt: Return, env: Environment):
+        val = None
+        if stmt.value is not None:
             val = self.eval_expression(stmt.value, env)
-            if isinstance(stmt.target, Identifier):
-                env.define(stmt.target.name, val)
-                return val
-            raise RuntimeErrorBPL("সিনট্যাক্স ত্রুটি: অপর্যাপ্ত অ্যাসাইনউপাদান")
-        if isinstance(stmt, FunctionDef):
-            fn = Function(stmt.name, stmt.params or [], stmt.body or [], env)
-            env.define(stmt.name, fn)
-            return None
-        if isinstance(stmt, If):
-            cond = self.eval_expression(stmt.test, env)
-            if self.is_truthy(cond):
-                for s in stmt.body:
-                    self.eval_statement(s, env)
-            else:
-                for s in stmt.orelse or []:
-                    self.eval_statement(s, env)
-            return None
-        if isinstance(stmt, While):
-            while self.is_truthy(self.eval_expression(stmt.test, env)):
-                for s in stmt.body:
-                    self.eval_statement(s, env)
-            return None
-        if isinstance(stmt, Return):
-            val = None
-            if stmt.value is not None:
-                val = self.eval_expression(stmt.value, env)
-            raise ReturnException(val)
-        raise RuntimeErrorBPL(f"রানটাইম ত্রুটি: অপরিচিত স্টেটমেন্ট {type(stmt)}")
+        raise ReturnException(val)
 
     def eval_expression(self, expr, env: Environment):
-        if isinstance(expr, Literal):
-            return expr.value
-        if isinstance(expr, Identifier):
-            # lookup
-            return env.get(expr.name)
-        if isinstance(expr, BinaryOp):
-            left = self.eval_expression(expr.left, env)
-            right = self.eval_expression(expr.right, env)
-            op = expr.op
-            try:
-                if op == "+":
-                    return left + right
-                if op == "-":
-                    return left - right
-                if op == "*":
-                    return left * right
-                if op == "/":
-                    return left / right
-                if op == "%":
-                    return left % right
-                if op == "==":
-                    return left == right
-                if op == "!=":
-                    return left != right
-                if op == "<":
-                    return left < right
-                if op == ">":
-                    return left > right
-                if op == "<=":
-                    return left <= right
-                if op == ">=":
-                    return left >= right
-                # logical Bangla operators
-                if op == "বা":
-                    return self.is_truthy(left) or self.is_truthy(right)
-                if op == "এবং":
-                    return self.is_truthy(left) and self.is_truthy(right)
-            except Exception as e:
-                raise RuntimeErrorBPL(f"টাইপ ত্রুটি: {e}")
-        if isinstance(expr, UnaryOp):
-            val = self.eval_expression(expr.operand, env)
-            if expr.op == "না":
-                return not self.is_truthy(val)
-            raise RuntimeErrorBPL(f"অজানা ইউনারি অপারেটর {expr.op}")
-        if isinstance(expr, Call):
-            # func can be Identifier with name or builtins
-            func_obj = None
-            if isinstance(expr.func, Identifier):
-                try:
-                    func_obj = env.get(expr.func.name)
-                except RuntimeErrorBPL:
-                    func_obj = None
-            # if builtin registered in global env
-            if func_obj is None and expr.func.name in self.global_env.vars:
-                func_obj = self.global_env.get(expr.func.name)
-
-            args = [self.eval_expression(a, env) for a in expr.args or []]
-            # if Python callable builtin
-            if callable(func_obj):
-                return func_obj(*args)
-            # if user Function
-            if isinstance(func_obj, Function):
-                return func_obj.call(args, self)
-            raise RuntimeErrorBPL(f"নাম ত্রুটি: অপরিচিত ফাংশন '{expr.func.name}'")
+        handler = self._expr_tab.get(type(expr))
+        if handler is None:
+            raise RuntimeErrorBPL("রানটাইম ত্রুটি: অপরিচিত এক্সপ্রেশন")
+        return handler(self, expr, env)
+
+    def _e_lit(self, expr: Literal, env: Environment):
+        return expr.value
+
+    def _e_id(self, expr: Identifier, env: Environment):
+        # lookup
+        return env.get(expr.name)
+
+    def _e_bin(self, expr: BinaryOp, env: Environment):
+        left = self.eval_expression(expr.left, env)
+        right = self.eval_expression(expr.right, env)
+        op = expr.op
+        fn = _BINOPS.get(op)
+        try:
+            if fn is not None:
+                return fn(left, right)
+            # logical Bangla operators
+            if op == "বা":
+                return self.is_truthy(left) or self.is_truthy(right)
+            if op == "এবং":
+                return self.is_truthy(left) and self.is_truthy(right)
+        except Exception as e:
+            raise RuntimeErrorBPL(f"টাইপ ত্রুটি: {e}")
         raise RuntimeErrorBPL("রানটাইম ত্রুটি: অপরিচিত এক্সপ্রেশন")
 
+    def _e_un(self, expr: UnaryOp, env: Environment):
+        val = self.eval_expression(expr.operand, env)
+        if expr.op == "না":
+            return not self.is_truthy(val)
+        raise RuntimeErrorBPL(f"অজানা ইউনারি অপারেটর {expr.op}")
+
+    def _e_call(self, expr: Call, env: Environment):
+        # func can be Identifier with name or builtins
+        func_obj = None
+        if isinstance(expr.func, Identifier):
+            try:
+                func_obj = env.get(expr.func.name)
+            except RuntimeErrorBPL:
+                func_obj = None
+        # if builtin registered in global env
+        if func_obj is None and expr.func.name in self.global_env.vars:
+            func_obj = self.global_env.get(expr.func.name)
+
+        args = [self.eval_expression(a, env) for a in expr.args or []]
+        # if Python callable builtin
+        if callable(func_obj):
+            return func_obj(*args)
+        # if user Function
+        if isinstance(func_obj, Function):
+            return func_obj.call(args, self)
+        raise RuntimeErrorBPL(f"নাম ত্রুটি: অপরিচিত ফাংশন '{expr.func.name}'")
+
+    # Exact node type -> handler; one dict probe replaces the isinstance chains
+    _stmt_tab = {
+        ExprStmt: _s_expr,
+        Assign: _s_assign,
+        FunctionDef: _s_funcdef,
+        If: _s_if,
+        While: _s_while,
+        Return: _s_return,
+    }
+    _expr_tab = {
+        Literal: _e_lit,
+        Identifier: _e_id,
+        BinaryOp: _e_bin,
+        UnaryOp: _e_un,
+        Call: _e_call,
+    }
+
     def is_truthy(self, v):
         if v is None:
             return False
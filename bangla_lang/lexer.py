@@ -9,16 +9,19 @@ small and easy to read so it can be extended.
 """
 from __future__ import annotations
 
+import re
+import sys
 import unicodedata
-from typing import List, Iterator, Optional
+from typing import Any, Dict, Iterable, List, Iterator, Optional, Tuple
 
 from .tokens import Token, INDENT, DEDENT, NEWLINE, EOF, IDENT, NUMBER, STRING, KEYWORD, OP, DELIM, BOOL, NIL
-from .utils import normalize_unicode, is_identifier_start, is_identifier_part
+from .utils import normalize_unicode, is_identifier_start, is_identifier_part, IDENTIFIER_PATTERN, gc_paused
 from .errors import LexError
 from .unicode_variants import (
-    is_keyword_variant, get_canonical_keyword,
-    is_logical_op_variant, get_canonical_logical_op,
-    CANONICAL_KEYWORDS
+    normalize_bangla_keyword,
+    KEYWORD_VARIANTS, LOGICAL_OPERATORS,
+    CANONICAL_KEYWORDS,
+    _NORM_KEYWORD_VARIANTS, _NORM_LOGICAL_OPERATORS,
 )
 
 
@@ -29,6 +32,62 @@ KEYWORDS = CANONICAL_KEYWORDS
 OPERATORS = ["==", "!=", "<=", ">=", "+", "-", "*", "/", "%", "<", ">", "="]
 DELIMITERS = {"(", ")", ":", ","}
 
+# Normalized word -> (token type, token value) for every keyword, boolean
+# and logical operator variant, so the identifier branch of the lexer does a
+# single normalization and a single dict probe. Keyword variants take
+# precedence over logical operators with the same normalized form. Built from
+# the already-normalized tables, so no normalization happens at import.
+# Canonical values are interned, so every keyword token carries the same str
+# object as the parser's literals and `tok.value == "যদি"` is decided by the
+# identity check before any characters are compared.
+WORD_TOKENS: Dict[str, Tuple[str, Any]] = {}
+for _norm, _canonical in _NORM_LOGICAL_OPERATORS.items():
+    WORD_TOKENS[_norm] = (KEYWORD, sys.intern(_canonical))
+for _norm, _canonical in _NORM_KEYWORD_VARIANTS.items():
+    _canonical = sys.intern(_canonical)
+    if _canonical == "সত্য":
+        _spec: Tuple[str, Any] = (BOOL, True)
+    elif _canonical == "মিথ্যা":
+        _spec = (BOOL, False)
+    else:
+        _spec = (KEYWORD, _canonical)
+    WORD_TOKENS[_norm] = _spec
+
+# One alternation for everything that can start at a given column; the regex
+# engine skips leading whitespace, then picks the token kind (`lastgroup`)
+# and its extent in a single call. The regex engine tries alternatives in
+# order, so the most frequent kinds come first; kinds starting with
+# different characters cannot compete, so this does not change what matches.
+# BADNUM precedes NUM, and malformed strings/numbers precede ERR, so they are
+# reported as such rather than as stray characters.
+# Lines come from splitlines(), so ERR always matches when nothing else does
+# and the whitespace prefix never has to backtrack. String bodies use the
+# unrolled form `[^"\\]*(?:\\.[^"\\]*)*` so plain runs are matched as one
+# character-class loop rather than one alternation per character.
+TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<ID>""" + IDENTIFIER_PATTERN + r""")
+      | (?P<OP>==|!=|<=|>=|[+\-*/%<>=])
+      | (?P<DELIM>[():,])
+      | (?P<BADNUM>\d+\.(?!\d))
+      | (?P<NUM>\d+(?:\.\d+)?)
+      | (?P<STR>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')
+      | (?P<BADSTR>["'])
+      | (?P<COMMENT>\#)
+      | (?P<END>$)
+      | (?P<ERR>.))""",
+    re.VERBOSE,
+)
+
+_INDENT_RE = re.compile(r"[ \t]*")
+_ESCAPE_RE = re.compile(r"\\(.)")
+_ESCAPES = {"n": "\n", "t": "\t"}
+
+
+def _unescape(m: re.Match) -> str:
+    c = m.group(1)
+    return _ESCAPES.get(c, c)
+
 
 class Lexer:
     def __init__(self, source: str, filename: str = "<input>"):
@@ -43,157 +102,136 @@ class Lexer:
         self._tokens: List[Token] = []
 
     def tokenize(self) -> List[Token]:
-        for i, raw_line in enumerate(self.lines):
-            self.lineno = i + 1
-            line = raw_line.rstrip("\n\r")
+        # One Token per lexeme and nothing freed until the end
+        with gc_paused():
+            return self._tokenize({})
+
+    @classmethod
+    def tokenize_many(cls, sources: Iterable[str], filename: str = "<input>") -> List[List[Token]]:
+        """Tokenize several sources; same result as `tokenize` on each.
+
+        The batch shares one GC pause and one word table, so a word seen in
+        an earlier source is not classified again (useful for test suites
+        and corpus tools that lex many small programs).
+        """
+        words: Dict[str, Tuple[str, Any]] = {}
+        with gc_paused():
+            return [cls(source, filename)._tokenize(words) for source in sources]
+
+    def _tokenize(self, words: Dict[str, Tuple[str, Any]]) -> List[Token]:
+        # `words` maps word -> (token type, value), so each distinct
+        # identifier is classified once and all its tokens share one value
+        # string instead of each holding its own copy.
+        # Line numbers come from the line loop itself, never from offsets
+        # into the source; everything that does not change per line is bound
+        # once here.
+        tokens = self._tokens
+        indent_stack = self.indent_stack
+        match = TOKEN_RE.match
+        lineno = 0
+        for lineno, raw_line in enumerate(self.lines, 1):
             # Skip empty lines (but emit NEWLINE so parser can handle)
-            if not line.strip():
+            if not raw_line or raw_line.isspace():
                 # Emit NEWLINE (but do not change indent)
-                self._tokens.append(Token(NEWLINE, "\n", self.lineno, 0))
+                tokens.append(Token(NEWLINE, "\n", lineno, 0))
                 continue
 
-            # Count leading spaces for indentation (tabs expanded to 4 spaces)
-            expanded = line.expandtabs(4)
-            indent = len(expanded) - len(expanded.lstrip(" "))
+            # Count leading spaces for indentation (tabs expanded to 4 spaces).
+            # Only the indentation prefix is expanded, and only if it has tabs.
+            start = _INDENT_RE.match(raw_line).end()
+            if "\t" in raw_line[:start]:
+                indent = len(raw_line[:start].expandtabs(4))
+            else:
+                indent = start
             self.col = indent + 1
 
-            if indent > self.indent_stack[-1]:
-                self.indent_stack.append(indent)
-                self._tokens.append(Token(INDENT, indent, self.lineno, 0))
-            while indent < self.indent_stack[-1]:
-                self.indent_stack.pop()
-                self._tokens.append(Token(DEDENT, indent, self.lineno, 0))
+            if indent > indent_stack[-1]:
+                indent_stack.append(indent)
+                tokens.append(Token(INDENT, indent, lineno, 0))
+            while indent < indent_stack[-1]:
+                indent_stack.pop()
+                tokens.append(Token(DEDENT, indent, lineno, 0))
 
             # tokenize the content of the line
+            text = raw_line[start:] if start else raw_line
+            col_offset = indent + 1
             i = 0
-            text = expanded.lstrip(" ")
-            col_offset = indent
-            while i < len(text):
-                ch = text[i]
-                col = col_offset + i + 1
-                # Skip spaces between tokens
-                if ch.isspace():
-                    i += 1
-                    continue
-
-                # Comments
-                if ch == "#":
-                    # comment: skip rest of line
-                    break
-
-                # String literal
-                if ch == '"' or ch == "'":
-                    quote = ch
-                    i += 1
-                    start = i
-                    val_chars = []
-                    escaped = False
-                    while i < len(text):
-                        c = text[i]
-                        if escaped:
-                            if c == "n":
-                                val_chars.append("\n")
-                            elif c == "t":
-                                val_chars.append("\t")
-                            elif c == "\\":
-                                val_chars.append("\\")
-                            elif c == quote:
-                                val_chars.append(quote)
-                            else:
-                                val_chars.append(c)
-                            escaped = False
-                            i += 1
-                            continue
-                        if c == "\\":
-                            escaped = True
+            n = len(text)
+            while i < n:
+                m = match(text, i)
+                kind = m.lastgroup
+                col = col_offset + m.start(kind)
+                i = m.end()
+
+                if kind == "ID" or kind == "ERR" and m.group(kind) > "\uffff" and is_identifier_start(m.group(kind)):
+                    # Identifier or keyword (Bangla or Latin). The pattern
+                    # covers the BMP; only astral characters need the
+                    # per-character checks, including an astral letter
+                    # starting the identifier (matched as ERR).
+                    if kind == "ERR" or i < n and text[i] > "\uffff":
+                        while i < n and is_identifier_part(text[i]):
                             i += 1
-                            continue
-                        if c == quote:
-                            i += 1
-                            break
-                        val_chars.append(c)
-                        i += 1
+                        name = text[m.start(kind):i]
                     else:
-                        raise LexError(f"সিনট্যাক্স ত্রুটি: স্ট্রিং সম্পূর্ণ হয়নি লাইন {self.lineno}")
-                    val = "".join(val_chars)
-                    self._tokens.append(Token(STRING, val, self.lineno, col))
+                        name = m.group(kind)
+                    spec = words.get(name)
+                    if spec is None:
+                        # Keyword, boolean and logical operator variants
+                        # (handles multiple keyboard layouts)
+                        spec = WORD_TOKENS.get(normalize_bangla_keyword(name))
+                        if spec is None:
+                            spec = (IDENT, name)
+                        words[name] = spec
+                    tokens.append(Token(spec[0], spec[1], lineno, col))
                     continue
 
-                # Number (integer or float)
-                if ch.isdigit():
-                    start_i = i
-                    while i < len(text) and text[i].isdigit():
-                        i += 1
-                    if i < len(text) and text[i] == ".":
-                        i += 1
-                        if i >= len(text) or not text[i].isdigit():
-                            raise LexError(f"সিনট্যাক্স ত্রুটি: অবৈধ সংখ্যা লাইন {self.lineno}")
-                        while i < len(text) and text[i].isdigit():
-                            i += 1
-                        tok_text = text[start_i:i]
-                        val = float(tok_text)
-                    else:
-                        tok_text = text[start_i:i]
-                        val = int(tok_text)
-                    self._tokens.append(Token(NUMBER, val, self.lineno, col))
+                if kind == "OP":
+                    tokens.append(Token(OP, m.group(kind), lineno, col))
                     continue
 
-                # Identifier or keyword (Bangla or Latin)
-                if is_identifier_start(ch):
-                    start_i = i
-                    while i < len(text) and is_identifier_part(text[i]):
-                        i += 1
-                    name = text[start_i:i]
-                    # Check for keyword variants (handles multiple keyboard layouts)
-                    if is_keyword_variant(name):
-                        canonical = get_canonical_keyword(name)
-                        # Special handling for boolean literals
-                        if canonical == "সত্য":
-                            self._tokens.append(Token(BOOL, True, self.lineno, col))
-                        elif canonical == "মিথ্যা":
-                            self._tokens.append(Token(BOOL, False, self.lineno, col))
-                        else:
-                            self._tokens.append(Token(KEYWORD, canonical, self.lineno, col))
-                    # Check for logical operator variants
-                    elif is_logical_op_variant(name):
-                        canonical = get_canonical_logical_op(name)
-                        self._tokens.append(Token(KEYWORD, canonical, self.lineno, col))
-                    elif name == "নিল":
-                        self._tokens.append(Token(NIL, None, self.lineno, col))
-                    else:
-                        self._tokens.append(Token(IDENT, name, self.lineno, col))
+                if kind == "DELIM":
+                    tokens.append(Token(DELIM, m.group(kind), lineno, col))
                     continue
 
-                # Operators (longest-first)
-                matched = False
-                for op in sorted(OPERATORS, key=lambda x: -len(x)):
-                    if text.startswith(op, i):
-                        self._tokens.append(Token(OP, op, self.lineno, col))
-                        i += len(op)
-                        matched = True
-                        break
-                if matched:
+                if kind == "NUM":
+                    tok_text = m.group(kind)
+                    val = float(tok_text) if "." in tok_text else int(tok_text)
+                    tokens.append(Token(NUMBER, val, lineno, col))
                     continue
 
-                # Delimiters
-                if ch in DELIMITERS:
-                    self._tokens.append(Token(DELIM, ch, self.lineno, col))
-                    i += 1
+                if kind == "STR":
+                    val = m.group(kind)[1:-1]
+                    if "\\" in val:
+                        val = _ESCAPE_RE.sub(_unescape, val)
+                    tokens.append(Token(STRING, val, lineno, col))
                     continue
 
+                # end of line, or comment: skip rest of line
+                if kind == "END" or kind == "COMMENT":
+                    break
+
+                if kind == "BADSTR":
+                    raise LexError(f"সিনট্যাক্স ত্রুটি: স্ট্রিং সম্পূর্ণ হয়নি লাইন {lineno}")
+
+                if kind == "BADNUM":
+                    raise LexError(f"সিনট্যাক্স ত্রুটি: অবৈধ সংখ্যা লাইন {lineno}")
+
                 # Unknown char
-                raise LexError(f"অবৈধ চিহ্ন: '{ch}' লাইন {self.lineno}")
+                raise LexError(f"অবৈধ চিহ্ন: '{m.group(kind)}' লাইন {lineno}")
 
             # At end of line emit NEWLINE
-            self._tokens.append(Token(NEWLINE, "\n", self.lineno, len(text) + 1))
+            tokens.append(Token(NEWLINE, "\n", lineno, len(text) + 1))
+        self.lineno = lineno
 
         # After all lines, unwind remaining indents
-        while len(self.indent_stack) > 1:
-            self.indent_stack.pop()
-            self._tokens.append(Token(DEDENT, 0, self.lineno, 0))
-
-        self._tokens.append(Token(EOF, None, self.lineno + 1, 0))
-        return self._tokens
+        while len(indent_stack) > 1:
+            indent_stack.pop()
+            tokens.append(Token(DEDENT, 0, lineno, 0))
+
+        # The stream always ends in EOF; the parser relies on this instead of
+        # bounds-checking every token read.
+        tokens.append(Token(EOF, None, lineno + 1, 0))
+        return tokens
 
 
 # Small helper to get tokens from source
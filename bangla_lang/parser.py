@@ -10,6 +10,17 @@ from .tokens import Token, INDENT, DEDENT, NEWLINE, EOF, IDENT, NUMBER, STRING,
 from .ast import Program, ExprStmt, Assign, Identifier, Literal, BinaryOp, UnaryOp, Call, FunctionDef, If, While, Return
 from .errors import ParseError
 
+# Binary operator -> precedence (higher binds tighter); all are left-associative.
+# 'বা' and 'এবং' arrive as KEYWORD tokens, the rest as OP tokens.
+_PREC = {
+    "বা": 1,
+    "এবং": 2,
+    "==": 3, "!=": 3,
+    "<": 4, ">": 4, "<=": 4, ">=": 4,
+    "+": 5, "-": 5,
+    "*": 6, "/": 6, "%": 6,
+}
+
 
 class Parser:
     def __init__(self, tokens: List[Token]):
@@ -25,235 +36,248 @@ class Parser:
         return tok
 
     def accept(self, *types) -> Optional[Token]:
-        if self.peek().type in types:
-            return self.advance()
+        tok = self.tokens[self.pos]
+        if tok.type in types:
+            self.pos += 1
+            return tok
         return None
 
     def expect(self, typ, value=None) -> Token:
-        tok = self.peek()
-        if tok.type != typ:
+        tok = self.tokens[self.pos]
+        if tok.type is typ and (value is None or tok.value == value):
+            self.pos += 1
+            return tok
+        if tok.type is not typ:
             raise ParseError(f"সিনট্যাক্স ত্রুটি: প্রত্যাশিত {typ} কিন্তু পাওয়া যায় {tok.type} লাইন {tok.lineno}")
-        if value is not None and tok.value != value:
-            raise ParseError(f"সিনট্যাক্স ত্রুটি: প্রত্যাশিত '{value}' কিন্তু পাওয়া যায় '{tok.value}' লাইন {tok.lineno}")
-        return self.advance()
+        raise ParseError(f"সিনট্যাক্স ত্রুটি: প্রত্যাশিত '{value}' কিন্তু পাওয়া যায় '{tok.value}' লাইন {tok.lineno}")
 
     def parse(self) -> Program:
         stmts = []
-        while self.peek().type != EOF:
-            if self.peek().type == NEWLINE:
-                self.advance()
+        tokens = self.tokens
+        while True:
+            typ = tokens[self.pos].type
+            if typ is EOF:
+                break
+            if typ is NEWLINE:
+                self.pos += 1
                 continue
             stmts.append(self.parse_statement())
         return Program(body=stmts)
 
     # Statements
     def parse_statement(self):
-        tok = self.peek()
-        if tok.type == KEYWORD and tok.value == "ফাংশন":
-            return self.parse_function_def()
-        if tok.type == KEYWORD and tok.value == "যদি":
-            return self.parse_if()
-        if tok.type == KEYWORD and tok.value == "যখন":
-            return self.parse_while()
-        if tok.type == KEYWORD and tok.value == "ফলাফল":
-            return self.parse_return()
+        tok = self.tokens[self.pos]
+        if tok.type is KEYWORD:
+            handler = self._statement_tab.get(tok.value)
+            if handler is not None:
+                return handler(self)
         # simple statement
         node = self.parse_simple_statement()
         # expect NEWLINE
-        if self.peek().type == NEWLINE:
-            self.advance()
+        if self.tokens[self.pos].type is NEWLINE:
+            self.pos += 1
         return node
 
     def parse_simple_statement(self):
         expr = self.parse_expression()
         # assignment
-        if self.peek().type == OP and self.peek().value == "=":
+        tok = self.tokens[self.pos]
+        if tok.type is OP and tok.value == "=":
             if not isinstance(expr, Identifier):
-                raise ParseError(f"সিনট্যাক্স ত্রুটি: বাম পাশে একটি নাম থাকতে হবে লাইন {self.peek().lineno}")
-            self.advance()  # consume '='
+                raise ParseError(f"সিনট্যাক্স ত্রুটি: বাম পাশে একটি নাম থাকতে হবে লাইন {tok.lineno}")
+            self.pos += 1  # consume '='
             value = self.parse_expression()
             return Assign(target=expr, value=value, lineno=expr.lineno, col=expr.col)
         return ExprStmt(value=expr, lineno=expr.lineno, col=expr.col)
 
+    def _parse_block(self) -> list:
+        """Parse `NEWLINE INDENT statement* DEDENT` and return the statements."""
+        self.expect(NEWLINE)
+        self.expect(INDENT)
+        tokens = self.tokens
+        parse_statement = self.parse_statement
+        body = []
+        while True:
+            typ = tokens[self.pos].type
+            if typ is DEDENT:
+                break
+            if typ is NEWLINE:
+                self.pos += 1
+                continue
+            body.append(parse_statement())
+        self.pos += 1  # consume DEDENT
+        return body
+
     def parse_function_def(self):
-        kw = self.expect(KEYWORD)
+        kw = self.tokens[self.pos]  # keyword already matched by parse_statement
+        self.pos += 1
         name_tok = self.expect(IDENT)
         name = name_tok.value
         self.expect(DELIM, "(")
+        tokens = self.tokens
         params = []
-        if self.peek().type != DELIM or self.peek().value != ")":
+        tok = tokens[self.pos]
+        if tok.type is not DELIM or tok.value != ")":
             while True:
-                p = self.expect(IDENT)
-                params.append(p.value)
-                if self.peek().type == DELIM and self.peek().value == ",":
-                    self.advance()
+                params.append(self.expect(IDENT).value)
+                tok = tokens[self.pos]
+                if tok.type is DELIM and tok.value == ",":
+                    self.pos += 1
                     continue
                 break
         self.expect(DELIM, ")")
         self.expect(DELIM, ":")
-        self.expect(NEWLINE)
-        self.expect(INDENT)
-        body = []
-        while self.peek().type != DEDENT:
-            if self.peek().type == NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(DEDENT)
+        body = self._parse_block()
         return FunctionDef(name=name, params=params, body=body, lineno=kw.lineno, col=kw.col)
 
     def parse_if(self):
-        kw = self.expect(KEYWORD)
+        kw = self.tokens[self.pos]  # keyword already matched by parse_statement
+        self.pos += 1
         test = self.parse_expression()
         self.expect(DELIM, ":")
-        self.expect(NEWLINE)
-        self.expect(INDENT)
-        body = []
-        while self.peek().type != DEDENT:
-            if self.peek().type == NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(DEDENT)
+        body = self._parse_block()
         orelse = []
-        if self.peek().type == KEYWORD and self.peek().value == "নইলে":
-            self.advance()
+        tok = self.tokens[self.pos]
+        if tok.type is KEYWORD and tok.value == "নইলে":
+            self.pos += 1
             self.expect(DELIM, ":")
-            self.expect(NEWLINE)
-            self.expect(INDENT)
-            while self.peek().type != DEDENT:
-                if self.peek().type == NEWLINE:
-                    self.advance()
-                    continue
-                orelse.append(self.parse_statement())
-            self.expect(DEDENT)
+            orelse = self._parse_block()
         return If(test=test, body=body, orelse=orelse, lineno=kw.lineno, col=kw.col)
 
     def parse_while(self):
-        kw = self.expect(KEYWORD)
+        kw = self.tokens[self.pos]  # keyword already matched by parse_statement
+        self.pos += 1
         test = self.parse_expression()
         self.expect(DELIM, ":")
-        self.expect(NEWLINE)
-        self.expect(INDENT)
-        body = []
-        while self.peek().type != DEDENT:
-            if self.peek().type == NEWLINE:
-                self.advance()
-                continue
-            body.append(self.parse_statement())
-        self.expect(DEDENT)
+        body = self._parse_block()
         return While(test=test, body=body, lineno=kw.lineno, col=kw.col)
 
     def parse_return(self):
-        kw = self.expect(KEYWORD)
-        if self.peek().type == NEWLINE:
-            self.advance()
+        kw = self.tokens[self.pos]  # keyword already matched by parse_statement
+        self.pos += 1
+        if self.tokens[self.pos].type is NEWLINE:
+            self.pos += 1
             return Return(value=None, lineno=kw.lineno, col=kw.col)
         value = self.parse_expression()
         return Return(value=value, lineno=kw.lineno, col=kw.col)
 
+    # Keyword -> compound statement parser
+    _statement_tab = {
+        "ফাংশন": parse_function_def,
+        "যদি": parse_if,
+        "যখন": parse_while,
+        "ফলাফল": parse_return,
+    }
+
     # Expressions (precedence climbing)
-    def parse_expression(self):
-        return self.parse_logic_or()
-
-    def parse_logic_or(self):
-        node = self.parse_logic_and()
-        while self.peek().type == KEYWORD and self.peek().value == "বা":
-            op = self.advance().value
-            right = self.parse_logic_and()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def parse_expression(self, min_prec: int = 1):
+        tokens = self.tokens
+        # The operand: parse_unary/parse_primary inlined, so a plain atom
+        # costs one handler call rather than a three-call chain.
+        tok = tokens[self.pos]
+        handler = self._primary_tab.get(tok.type)
+        if handler is None:
+            return self._p_unexpected(tok)
+        if tok.type is KEYWORD and tok.value == "না":
+            node = self.parse_unary()
+        else:
+            node = handler(self, tok)
+        while True:
+            tok = tokens[self.pos]
+            if tok.type is not OP and tok.type is not KEYWORD:
+                return node
+            prec = _PREC.get(tok.value)
+            if prec is None or prec < min_prec:
+                return node
+            self.pos += 1
+            right = self.parse_expression(prec + 1)
+            node = BinaryOp(left=node, op=tok.value, right=right)
 
-    def parse_logic_and(self):
-        node = self.parse_equality()
-        while self.peek().type == KEYWORD and self.peek().value == "এবং":
-            op = self.advance().value
-            right = self.parse_equality()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def parse_unary(self):
+        tok = self.tokens[self.pos]
+        if tok.type is KEYWORD and tok.value == "না":
+            self.pos += 1
+            operand = self.parse_unary()
+            return UnaryOp(op=tok.value, operand=operand)
+        return self.parse_primary()
 
-    def parse_equality(self):
-        node = self.parse_comparison()
-        while self.peek().type == OP and self.peek().value in ("==", "!="):
-            op = self.advance().value
-            right = self.parse_comparison()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def parse_primary(self):
+        tok = self.tokens[self.pos]
+        handler = self._primary_tab.get(tok.type)
+        if handler is None:
+            return self._p_unexpected(tok)
+        return handler(self, tok)
 
-    def parse_comparison(self):
-        node = self.parse_term()
-        while self.peek().type == OP and self.peek().value in ("<", ">", "<=", ">="):
-            op = self.advance().value
-            right = self.parse_term()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def _p_number(self, tok: Token):
+        self.pos += 1
+        return Literal(value=tok.value, typ="number", lineno=tok.lineno, col=tok.col)
 
-    def parse_term(self):
-        node = self.parse_factor()
-        while self.peek().type == OP and self.peek().value in ("+", "-"):
-            op = self.advance().value
-            right = self.parse_factor()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def _p_string(self, tok: Token):
+        self.pos += 1
+        return Literal(value=tok.value, typ="string", lineno=tok.lineno, col=tok.col)
 
-    def parse_factor(self):
-        node = self.parse_unary()
-        while self.peek().type == OP and self.peek().value in ("*", "/", "%"):
-            op = self.advance().value
-            right = self.parse_unary()
-            node = BinaryOp(left=node, op=op, right=right)
-        return node
+    def _p_bool(self, tok: Token):
+        self.pos += 1
+        return Literal(value=tok.value, typ="bool", lineno=tok.lineno, col=tok.col)
 
-    def parse_unary(self):
-        if self.peek().type == KEYWORD and self.peek().value == "না":
-            op = self.advance().value
-            operand = self.parse_unary()
-            return UnaryOp(op=op, operand=operand)
-        return self.parse_primary()
+    def _p_nil(self, tok: Token):
+        self.pos += 1
+        return Literal(value=None, typ="nil", lineno=tok.lineno, col=tok.col)
 
-    def parse_primary(self):
-        tok = self.peek()
-        if tok.type == NUMBER:
-            self.advance()
-            return Literal(value=tok.value, typ="number", lineno=tok.lineno, col=tok.col)
-        if tok.type == STRING:
-            self.advance()
-            return Literal(value=tok.value, typ="string", lineno=tok.lineno, col=tok.col)
-        if tok.type == BOOL:
-            self.advance()
-            return Literal(value=tok.value, typ="bool", lineno=tok.lineno, col=tok.col)
-        if tok.type == NIL:
-            self.advance()
-            return Literal(value=None, typ="nil", lineno=tok.lineno, col=tok.col)
-        if tok.type == IDENT or (tok.type == KEYWORD and tok.value == "দেখাও"):
-            # function name can be IDENT or builtin keyword 'দেখাও'
-            self.advance()
-            name = tok.value
-            # function call
-            if self.peek().type == DELIM and self.peek().value == "(":
-                self.advance()
-                args = []
-                if not (self.peek().type == DELIM and self.peek().value == ")"):
-                    while True:
-                        args.append(self.parse_expression())
-                        if self.peek().type == DELIM and self.peek().value == ",":
-                            self.advance()
-                            continue
-                        break
-                self.expect(DELIM, ")")
-                return Call(func=Identifier(name=name, lineno=tok.lineno, col=tok.col), args=args, lineno=tok.lineno, col=tok.col)
-            return Identifier(name=name, lineno=tok.lineno, col=tok.col)
-        if tok.type == DELIM and tok.value == "(":
-            self.advance()
-            node = self.parse_expression()
+    def _p_name(self, tok: Token):
+        tokens = self.tokens
+        self.pos += 1
+        name = tok.value
+        # function call
+        nxt = tokens[self.pos]
+        if nxt.type is DELIM and nxt.value == "(":
+            self.pos += 1
+            args = []
+            nxt = tokens[self.pos]
+            if not (nxt.type is DELIM and nxt.value == ")"):
+                while True:
+                    args.append(self.parse_expression())
+                    nxt = tokens[self.pos]
+                    if nxt.type is DELIM and nxt.value == ",":
+                        self.pos += 1
+                        continue
+                    break
             self.expect(DELIM, ")")
-            return node
+            return Call(func=Identifier(name=name, lineno=tok.lineno, col=tok.col), args=args, lineno=tok.lineno, col=tok.col)
+        return Identifier(name=name, lineno=tok.lineno, col=tok.col)
+
+    def _p_keyword(self, tok: Token):
+        # function name can be IDENT or builtin keyword 'দেখাও'
+        if tok.value == "দেখাও":
+            return self._p_name(tok)
+        return self._p_unexpected(tok)
+
+    def _p_delim(self, tok: Token):
+        if tok.value != "(":
+            return self._p_unexpected(tok)
+        self.pos += 1
+        node = self.parse_expression()
+        self.expect(DELIM, ")")
+        return node
+
+    def _p_unexpected(self, tok: Token):
         raise ParseError(f"সিনট্যাক্স ত্রুটি: অপ্রত্যাশিত token '{tok.type}' লাইন {tok.lineno}")
 
+    # Token type -> primary-expression handler
+    _primary_tab = {
+        NUMBER: _p_number,
+        STRING: _p_string,
+        BOOL: _p_bool,
+        NIL: _p_nil,
+        IDENT: _p_name,
+        KEYWORD: _p_keyword,
+        DELIM: _p_delim,
+    }
+
 
 def parse_tokens(tokens: List[Token]) -> Program:
-    p = Parser(tokens)
-    try:
-        return p.parse()
-    except IndexError:
+    # The parser never reads past an EOF token, so a stream that ends in one
+    # (as the lexer's always does) cannot run off the end of the list.
+    if not tokens or tokens[-1].type is not EOF:
         raise ParseError("সিনট্যাক্স ত্রুটি: অপ্রত্যাশিত EOF")
+    return Parser(tokens).parse()
@@ -1,56 +1,111 @@
 """Simple REPL for Bangla Programming Language (BPL).
 
-For now the REPL tokenizes input and prints tokens; later it will parse and
-evaluate code.
+Each complete statement is compiled and run on one persistent VM, so names
+defined on earlier lines stay visible. A line ending in ':' opens a block,
+which is read with CONT_PROMPT until an empty line, as in Python.
 """
 import readline
 import os
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from .lexer import lex
-from .runtime import bpl_print
+from .parser import parse_tokens
+from .compiler import Compiler
+from .bytecode import VM
 from .cli import run_source, run_file
 
 HISTORY = os.path.expanduser("~/.bpl_history")
 PROMPT = "বিপিএল> "
 CONT_PROMPT = "...> "
+HISTORY_LENGTH = 1000
+# Run once at startup, in a scratch namespace, so the first real line does
+# not pay for warming the lexer, compiler and VM paths.
+_WARMUP = "যদি সত্য:\n    _ = 1 + 1\n"
+
+
+class Interp:
+    """Interpreter state shared by all lines of a REPL session."""
+
+    def __init__(self, vm: Optional[VM] = None):
+        self.vm = vm or VM()
+        self.globals: Dict[str, Any] = {}
+        self.buffer: List[str] = []
+
+    def feed(self, line: str) -> bool:
+        """Add a line of input; return True if more lines are needed.
+
+        Complete input is run immediately. On error the buffered block is
+        discarded and the exception propagates to the caller.
+        """
+        if self.buffer:
+            if line.strip():
+                self.buffer.append(line)
+                return True
+        elif line.rstrip().endswith(":"):
+            self.buffer.append(line)
+            return True
+        else:
+            self.buffer.append(line)
+        source = "\n".join(self.buffer) + "\n"
+        self.buffer = []
+        self.run(source)
+        return False
+
+    def run(self, source: str):
+        code = Compiler().compile(parse_tokens(lex(source)))
+        return self.vm.run_code(code, self.globals)
 
 
 def load_history():
+    readline.set_history_length(HISTORY_LENGTH)
     try:
         readline.read_history_file(HISTORY)
     except FileNotFoundError:
-        pass
+        # Create it so per-line appends have a file to extend
+        try:
+            open(HISTORY, "a").close()
+        except OSError:
+            pass
+
 
+def append_history(count: int = 1):
+    """Append the last `count` history entries to the history file.
 
-def save_history():
+    Done after every line, so history survives a crash and exiting does not
+    rewrite the whole file. The file is kept to HISTORY_LENGTH entries.
+    """
     try:
-        readline.write_history_file(HISTORY)
+        readline.append_history_file(count, HISTORY)
     except Exception:
         pass
 
 
 def repl():
     load_history()
-    try:
-        while True:
-            try:
-                src = input(PROMPT)
-            except EOFError:
-                print()
-                break
-            if not src.strip():
+    interp = Interp()
+    Interp(interp.vm).run(_WARMUP)
+    saved = readline.get_current_history_length()
+    while True:
+        try:
+            src = input(CONT_PROMPT if interp.buffer else PROMPT)
+        except EOFError:
+            print()
+            break
+        # Only lines readline actually recorded (non-empty, interactive)
+        recorded = readline.get_current_history_length()
+        if recorded > saved:
+            append_history(recorded - saved)
+            saved = recorded
+        if not interp.buffer:
+            line = src.strip()
+            if not line:
                 continue
-            if src.strip() in ("exit", "প্রস্থান"):
+            if line in ("exit", "প্রস্থান"):
                 break
-            # Try to run the source line (simple) using runner
-            try:
-                # run_source expects full source; for REPL we'll try to run a single line
-                run_source(src)
-            except Exception as e:
-                print(str(e))
-    finally:
-        save_history()
+        try:
+            interp.feed(src)
+        except Exception as e:
+            print(str(e))
 
 
 if __name__ == "__main__":
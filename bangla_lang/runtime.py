@@ -1,22 +1,37 @@
 """Built-in runtime helpers for BPL."""
+import sys
 from typing import Any
 
 
 def bpl_print(*args: Any) -> None:
-    # Print arguments separated by space, support unicode strings
-    out = " ".join(str(a) for a in args)
-    print(out, flush=True)
+    # Print arguments separated by space. The line is joined first and
+    # written in one call: print() writes each argument and separator
+    # separately, which costs more than the join once stdout is flushed.
+    out = sys.stdout
+    out.write(" ".join(map(str, args)) + "\n")
+    out.flush()
+
+
+def bpl_print_to(buf: bytearray, *args: Any) -> None:
+    """`bpl_print` into an in-memory UTF-8 sink instead of stdout.
+
+    Bind with `functools.partial(bpl_print_to, buf)` to capture a program's
+    output without swapping `sys.stdout`; decode `buf` once at the end.
+    """
+    buf += " ".join(map(str, args)).encode("utf-8")
+    buf.append(0x0A)
+
+
+# Exact value type -> BPL type name. Keyed on type(x), so bool is not
+# mistaken for int as it would be with isinstance.
+_TYPE_NAMES = {
+    type(None): "নিল",
+    bool: "বুলীয়ান",
+    int: "ইন্ট",
+    float: "ফ্লোট",
+    str: "স্ট্রিং",
+}
 
 
 def bpl_type(x: Any) -> str:
-    if x is None:
-        return "নিল"
-    if isinstance(x, bool):
-        return "বুলীয়ান"
-    if isinstance(x, int):
-        return "ইন্ট"
-    if isinstance(x, float):
-        return "ফ্লোট"
-    if isinstance(x, str):
-        return "স্ট্রিং"
-    return "অজানা"  # for functions/objects
+    return _TYPE_NAMES.get(type(x), "অজানা")  # for functions/objects
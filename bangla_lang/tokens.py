@@ -1,9 +1,13 @@
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 
 @dataclass
 class Token:
+    # One instance per lexeme: no per-instance __dict__
+    __slots__ = ("type", "value", "lineno", "col")
+
     type: str
     value: Any
     lineno: int
@@ -13,17 +17,17 @@ class Token:
         return f"Token({self.type!r}, {self.value!r}, line={self.lineno}, col={self.col})"
 
 
-# Token type constants
-INDENT = "INDENT"
-DEDENT = "DEDENT"
-NEWLINE = "NEWLINE"
-EOF = "EOF"
-IDENT = "IDENT"
-NUMBER = "NUMBER"
-STRING = "STRING"
-KEYWORD = "KEYWORD"
-OP = "OP"
-DELIM = "DELIM"
-COMMENT = "COMMENT"
-BOOL = "BOOL"
-NIL = "NIL"
+# Token type constants. Interned so the parser can compare types with `is`.
+INDENT = sys.intern("INDENT")
+DEDENT = sys.intern("DEDENT")
+NEWLINE = sys.intern("NEWLINE")
+EOF = sys.intern("EOF")
+IDENT = sys.intern("IDENT")
+NUMBER = sys.intern("NUMBER")
+STRING = sys.intern("STRING")
+KEYWORD = sys.intern("KEYWORD")
+OP = sys.intern("OP")
+DELIM = sys.intern("DELIM")
+COMMENT = sys.intern("COMMENT")
+BOOL = sys.intern("BOOL")
+NIL = sys.intern("NIL")
@@ -8,22 +8,60 @@ common variants.
 Example: ফাংশন and ফংশন both map to the FUNCTION keyword.
 """
 import unicodedata
-from typing import Dict, Set
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 
+_COMBINING_CATEGORIES = ('Mn', 'Mc', 'Me')
+
+
+def _combining_mark_ranges() -> List[Tuple[int, int]]:
+    """Inclusive (first, last) codepoint runs of the BMP combining marks."""
+    ranges = []
+    for cp in range(0x10000):
+        if unicodedata.category(chr(cp)) in _COMBINING_CATEGORIES:
+            if ranges and ranges[-1][1] == cp - 1:
+                ranges[-1] = (ranges[-1][0], cp)
+            else:
+                ranges.append((cp, cp))
+    return ranges
+
+
+# Tables precomputed by tools/gen_variants.py. They are only trusted for the
+# Unicode database they were generated against (and, below, for the variant
+# dicts they were generated from); otherwise everything is rebuilt here.
+try:
+    from . import _variants_table as _table
+except ImportError:  # pragma: no cover - source tree without the table
+    _table = None
+if _table is not None and _table.UNIDATA_VERSION != unicodedata.unidata_version:
+    _table = None
+
+# Every combining mark (Mn, Mc, Me) in the BMP mapped to None, for use with
+# `str.translate`, which strips them in a single C-level pass.
+_STRIP_MARKS: Dict[int, None] = dict.fromkeys(
+    cp
+    for first, last in (_table.MARK_RANGES if _table else _combining_mark_ranges())
+    for cp in range(first, last + 1)
+)
+
+
+@lru_cache(maxsize=4096)
 def normalize_bangla_keyword(word: str) -> str:
     """Normalize a Bangla word by decomposing, normalizing, and removing combining marks.
     
     This ensures keywords work across different Bangla keyboard layouts and
-    Unicode normalization forms.
+    Unicode normalization forms. Results are cached, since the lexer calls
+    this for every identifier and the same names recur throughout a file.
     """
-    # First normalize to NFD (decomposed) form
-    nfd = unicodedata.normalize('NFD', word)
-    # Remove combining marks (category Mn, Mc, Me)
-    cleaned = ''.join(
-        ch for ch in nfd 
-        if unicodedata.category(ch) not in ('Mn', 'Mc', 'Me')
-    )
+    # First normalize to NFD (decomposed) form, then remove combining marks
+    cleaned = unicodedata.normalize('NFD', word).translate(_STRIP_MARKS)
+    # Marks outside the BMP are not in the table
+    if not cleaned.isascii() and max(cleaned) > '\uffff':
+        cleaned = ''.join(
+            ch for ch in cleaned
+            if unicodedata.category(ch) not in _COMBINING_CATEGORIES
+        )
     # Normalize back to NFC (composed) form
     return unicodedata.normalize('NFC', cleaned)
 
@@ -101,14 +139,45 @@ CANONICAL_LOGICAL_OPS: Set[str] = {
     'এবং', 'বা', 'না'
 }
 
-# Normalize mapping keys so lookups are consistent across Unicode forms
-_NORM_KEYWORD_VARIANTS: Dict[str, str] = {}
-for k, v in KEYWORD_VARIANTS.items():
-    _NORM_KEYWORD_VARIANTS[normalize_bangla_keyword(k)] = v
+# Normalize mapping keys so lookups are consistent across Unicode forms.
+# These tables are never modified after import, which is what makes the
+# lru_cache on lookup_keyword/lookup_logical_op below safe.
+def _normalized_keys(table: Dict[str, str]) -> Dict[str, str]:
+    return {normalize_bangla_keyword(k): v for k, v in table.items()}
+
+
+if (_table is not None
+        and _table.KEYWORD_VARIANTS == KEYWORD_VARIANTS
+        and _table.LOGICAL_OPERATORS == LOGICAL_OPERATORS):
+    _NORM_KEYWORD_VARIANTS: Dict[str, str] = _table.NORM_KEYWORD_VARIANTS
+    _NORM_LOGICAL_OPERATORS: Dict[str, str] = _table.NORM_LOGICAL_OPERATORS
+else:
+    _NORM_KEYWORD_VARIANTS = _normalized_keys(KEYWORD_VARIANTS)
+    _NORM_LOGICAL_OPERATORS = _normalized_keys(LOGICAL_OPERATORS)
+
+
+# Variants exactly as spelled above. Well-formed source hits these directly,
+# so normalization is only needed for spellings not listed verbatim.
+_RAW_KEYWORD_VARIANTS: Dict[str, str] = dict(KEYWORD_VARIANTS)
+_RAW_LOGICAL_OPERATORS: Dict[str, str] = dict(LOGICAL_OPERATORS)
+
+
+@lru_cache(maxsize=1024)
+def lookup_keyword(word: str) -> Optional[str]:
+    """Return the canonical keyword for `word`, or None if it is not a keyword variant."""
+    canonical = _RAW_KEYWORD_VARIANTS.get(word)
+    if canonical is not None:
+        return canonical
+    return _NORM_KEYWORD_VARIANTS.get(normalize_bangla_keyword(word))
+
 
-_NORM_LOGICAL_OPERATORS: Dict[str, str] = {}
-for k, v in LOGICAL_OPERATORS.items():
-    _NORM_LOGICAL_OPERATORS[normalize_bangla_keyword(k)] = v
+@lru_cache(maxsize=1024)
+def lookup_logical_op(word: str) -> Optional[str]:
+    """Return the canonical logical operator for `word`, or None if it is not one."""
+    canonical = _RAW_LOGICAL_OPERATORS.get(word)
+    if canonical is not None:
+        return canonical
+    return _NORM_LOGICAL_OPERATORS.get(normalize_bangla_keyword(word))
 
 
 def get_canonical_keyword(word: str) -> str:
@@ -117,23 +186,21 @@ def get_canonical_keyword(word: str) -> str:
     Returns the canonical form if the word is a known keyword variant,
     otherwise returns the word unchanged.
     """
-    normalized = normalize_bangla_keyword(word)
-    return _NORM_KEYWORD_VARIANTS.get(normalized, word)
+    canonical = lookup_keyword(word)
+    return word if canonical is None else canonical
 
 
 def get_canonical_logical_op(word: str) -> str:
     """Given a Bangla word, return the canonical logical operator form if it's a variant."""
-    normalized = normalize_bangla_keyword(word)
-    return _NORM_LOGICAL_OPERATORS.get(normalized, word)
+    canonical = lookup_logical_op(word)
+    return word if canonical is None else canonical
 
 
 def is_keyword_variant(word: str) -> bool:
     """Check if a word is any variant of a keyword."""
-    normalized = normalize_bangla_keyword(word)
-    return normalized in _NORM_KEYWORD_VARIANTS
+    return lookup_keyword(word) is not None
 
 
 def is_logical_op_variant(word: str) -> bool:
     """Check if a word is any variant of a logical operator."""
-    normalized = normalize_bangla_keyword(word)
-    return normalized in _NORM_LOGICAL_OPERATORS
+    return lookup_logical_op(word) is not None
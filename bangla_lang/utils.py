@@ -1,14 +1,73 @@
+import gc
+import re
 import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
 
 
-def normalize_unicode(s: str) -> str:
-    """Normalize source text to NFC for consistent tokenization."""
+@lru_cache(maxsize=64)
+def _normalize_nfc(s: str) -> str:
+    if unicodedata.is_normalized("NFC", s):
+        return s
     return unicodedata.normalize("NFC", s)
 
 
-def is_identifier_start(ch: str) -> bool:
-    """Return True if character can start an identifier (letter or underscore).
-    Accepts Bangla letters because they are category 'L'."""
+def normalize_unicode(s: str) -> str:
+    """Normalize source text to NFC for consistent tokenization.
+
+    ASCII text is already NFC and is returned as is; other sources are
+    cached so re-lexing the same snippet (REPL, tests) skips the work.
+    """
+    if s.isascii():
+        return s
+    return _normalize_nfc(s)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Suspend the cyclic garbage collector for a bulk allocation.
+
+    Building a token list (or tree) allocates many small container objects
+    without freeing any, which would otherwise trigger a young-generation
+    collection every few hundred allocations that cannot find any garbage.
+    Leaves the collector disabled if it already was.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+# Per-codepoint flags for the BMP: one table load answers the identifier
+# predicates below instead of several str/unicodedata calls per character.
+_START = 1
+_PART = 2
+_MARK = 4
+
+
+def _build_char_flags() -> bytearray:
+    flags = bytearray(0x10000)
+    for cp in range(0x10000):
+        ch = chr(cp)
+        if ch.isalpha():
+            flags[cp] = _START | _PART
+        elif ch.isdigit():
+            flags[cp] = _PART
+        elif unicodedata.category(ch) in ("Mc", "Mn"):
+            flags[cp] = _PART | _MARK
+    flags[ord("_")] = _START | _PART
+    return flags
+
+
+_CHAR_FLAGS = _build_char_flags()
+
+
+def _slow_identifier_start(ch: str) -> bool:
     if not ch:
         return False
     if ch == "_":
@@ -16,8 +75,7 @@ def is_identifier_start(ch: str) -> bool:
     return ch.isalpha()
 
 
-def is_identifier_part(ch: str) -> bool:
-    """Return True if character can be part of identifier (letter, digit, underscore, combining marks)."""
+def _slow_identifier_part(ch: str) -> bool:
     if not ch:
         return False
     if ch == "_":
@@ -29,3 +87,43 @@ def is_identifier_part(ch: str) -> bool:
     if cat in ("Mc", "Mn"):
         return True
     return False
+
+
+def is_identifier_start(ch: str) -> bool:
+    """Return True if character can start an identifier (letter or underscore).
+    Accepts Bangla letters because they are category 'L'."""
+    if len(ch) == 1:
+        cp = ord(ch)
+        if cp < 0x10000:
+            return bool(_CHAR_FLAGS[cp] & _START)
+    return _slow_identifier_start(ch)
+
+
+def is_identifier_part(ch: str) -> bool:
+    """Return True if character can be part of identifier (letter, digit, underscore, combining marks)."""
+    if len(ch) == 1:
+        cp = ord(ch)
+        if cp < 0x10000:
+            return bool(_CHAR_FLAGS[cp] & _PART)
+    return _slow_identifier_part(ch)
+
+
+def _flag_class(mask: int) -> str:
+    """Regex character-class body for the BMP code points with `mask` set."""
+    # A bytes regex over the flag table finds the runs in one pass instead
+    # of a Python loop over the BMP.
+    values = bytes(v for v in range(256) if v & mask)
+    run = re.compile(b"[" + re.escape(values) + b"]+")
+    ranges = [(m.start(), m.end() - 1) for m in run.finditer(_CHAR_FLAGS)]
+    return "".join(
+        re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}"
+        for a, b in ranges
+    )
+
+
+# Regex form of `is_identifier_start` followed by `is_identifier_part`*,
+# built from the same flag table so the two cannot disagree in the BMP.
+# Characters outside the BMP are not in either class; callers should keep
+# extending a match while `is_identifier_part` holds, and check
+# `is_identifier_start` for an astral character the pattern did not match.
+IDENTIFIER_PATTERN = f"[{_flag_class(_START)}][{_flag_class(_PART)}]*"
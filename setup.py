@@ -0,0 +1,66 @@
+"""Optional native build for the BPL front end.
+
+All project metadata lives in pyproject.toml. This file only adds compiled
+versions of the front end (tokens, lexer, parser, compiler) and the Unicode
+helpers when explicitly requested:
+
+    BPL_CYTHON=1 pip install .
+
+The modules stay plain Python, so without Cython or a C toolchain (or
+without BPL_CYTHON) the regular pure-Python package is built: a module
+that fails to compile is skipped and its .py file is used instead.
+"""
+import os
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+NATIVE_MODULES = [
+    "bangla_lang/tokens.py",
+    "bangla_lang/lexer.py",
+    "bangla_lang/parser.py",
+    "bangla_lang/compiler.py",
+    "bangla_lang/unicode_variants.py",
+    "bangla_lang/utils.py",
+]
+
+
+def native_extensions():
+    if os.environ.get("BPL_CYTHON", "") in ("", "0"):
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("BPL_CYTHON is set but Cython is not installed; building pure-Python package")
+        return []
+    # bangla_lang has no __init__.py, so Cython cannot infer the dotted
+    # module names from the paths; spell them out.
+    extensions = [Extension(path[:-3].replace("/", "."), [path]) for path in NATIVE_MODULES]
+    return cythonize(extensions, language_level=3, quiet=True)
+
+
+class optional_build_ext(build_ext):
+    """build_ext that falls back to the pure-Python modules on failure."""
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as e:
+            print(f"cannot build native modules ({e}); building pure-Python package")
+
+    def build_extensions(self):
+        self.check_extensions_list(self.extensions)
+        built = []
+        for ext in self.extensions:
+            try:
+                self.build_extension(ext)
+            except (CCompilerError, ExecError, PlatformError) as e:
+                print(f"cannot build {ext.name} ({e}); using the pure-Python module")
+            else:
+                built.append(ext)
+        # Later steps (inplace copies, installed outputs) only see what built
+        self.extensions = built
+
+
+setup(ext_modules=native_extensions(), cmdclass={"build_ext": optional_build_ext})
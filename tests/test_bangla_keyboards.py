@@ -15,6 +15,8 @@ from bangla_lang.unicode_variants import (
     is_keyword_variant,
     get_canonical_logical_op,
     is_logical_op_variant,
+    lookup_keyword,
+    lookup_logical_op,
 )
 
 
@@ -106,6 +108,13 @@ class TestKeywordVariants:
             canonical = get_canonical_keyword(variant)
             assert canonical == "মিথ্যা", f"False variant failed: {variant}"
 
+    def test_lookup_returns_none_for_non_keywords(self):
+        """Test single-probe lookups for keywords, operators and plain names."""
+        assert lookup_keyword("ফংশন") == "ফাংশন"
+        assert lookup_keyword("অজানা") is None
+        assert lookup_logical_op("অথবা") == "বা"
+        assert lookup_logical_op("ফাংশন") is None
+
 
 class TestUnicodeNormalization:
     """Test Unicode normalization for keyboard variant handling."""
@@ -138,6 +147,25 @@ class TestUnicodeNormalization:
         norm2 = normalize_bangla_keyword(word)
         assert norm1 == norm2, "Normalization should be deterministic"
 
+    def test_normalize_decomposed_input(self):
+        """Test that NFD input normalizes like its composed form (cached or not)."""
+        word = "অন্যথায়"
+        nfc = normalize_bangla_keyword(unicodedata.normalize('NFC', word))
+        nfd = normalize_bangla_keyword(unicodedata.normalize('NFD', word))
+        assert nfc == nfd
+        assert normalize_bangla_keyword(unicodedata.normalize('NFD', word)) == nfd
+
+    def test_generated_table_is_current(self):
+        """Test _variants_table.py matches the variant dicts (rerun tools/gen_variants.py)."""
+        from bangla_lang import _variants_table as table
+        from bangla_lang import unicode_variants as uv
+        assert table.KEYWORD_VARIANTS == uv.KEYWORD_VARIANTS
+        assert table.LOGICAL_OPERATORS == uv.LOGICAL_OPERATORS
+        assert table.NORM_KEYWORD_VARIANTS == uv._normalized_keys(uv.KEYWORD_VARIANTS)
+        assert table.NORM_LOGICAL_OPERATORS == uv._normalized_keys(uv.LOGICAL_OPERATORS)
+        if table.UNIDATA_VERSION == unicodedata.unidata_version:
+            assert table.MARK_RANGES == uv._combining_mark_ranges()
+
 
 class TestLexerKeyboardVariants:
     """Integration tests for lexer with keyboard variants."""
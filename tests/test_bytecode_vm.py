@@ -1,11 +1,17 @@
-import sys
-import io
+import functools
+
+import pytest
 
 from bangla_lang.lexer import Lexer
 from bangla_lang.parser import Parser
 from bangla_lang.compiler import Compiler
-from bangla_lang.bytecode import VM
+from bangla_lang.bytecode import (
+    VM, OPNAMES, FAST_ADD_FF, FAST_MUL_FF, FAST_DIV_FC, LOAD_CONST, POP_TOP, RETURN_CONST, RETURN_VALUE,
+    BINARY_DIV, CALL_RETURN,
+)
+from bangla_lang.evaluator import run_program
 from bangla_lang import runtime
+from bangla_lang.errors import RuntimeErrorBPL
 
 
 def run_source_and_capture(source: str):
@@ -15,20 +21,233 @@ def run_source_and_capture(source: str):
     ast = parser.parse()
     comp = Compiler()
     codeobj = comp.compile(ast)
-    # Bind builtins into VM
-    builtins = {"দেখাও": runtime.bpl_print, "প্রকার": runtime.bpl_type}
+    # Bind builtins into VM, with দেখাও writing into a local buffer
+    out = bytearray()
+    builtins = {"দেখাও": functools.partial(runtime.bpl_print_to, out), "প্রকার": runtime.bpl_type}
     vm = VM(builtins=builtins)
-    # Capture stdout
-    old = sys.stdout
-    sys.stdout = io.StringIO()
-    try:
-        vm.run_code(codeobj, globals_={})
-        return sys.stdout.getvalue()
-    finally:
-        sys.stdout = old
+    vm.run_code(codeobj, globals_={})
+    return out.decode("utf-8")
 
 
 def test_print_and_add():
     src = 'ফাংশন add(a, b):\n  ফলাফল a + b\n\nদেখাও(add(2, 3))\n'
     out = run_source_and_capture(src)
     assert "5" in out
+
+
+def test_arithmetic_ops():
+    src = 'দেখাও(10 - 4, 3 * 4, 9 / 2, 1 + 2 * 3)\n'
+    out = run_source_and_capture(src)
+    assert out.strip() == "6 12 4.5 7"
+
+
+def test_function_locals_use_fast_slots():
+    src = 'ফাংশন f(a):\n  b = a * 2\n  ফলাফল b + 1\n\nদেখাও(f(4))\n'
+    lex = Lexer(src)
+    codeobj = Compiler().compile(Parser(lex.tokenize()).parse())
+    func = codeobj.consts[0]
+    assert func.varnames == ["a", "b"]
+    assert func.names == []
+    assert run_source_and_capture(src).strip() == "9"
+
+
+def test_peephole_fuses_fast_binary_ops():
+    src = 'ফাংশন f(a, b):\n  ফলাফল a * b - a / 2\n\nদেখাও(f(4, 3))\n'
+    lex = Lexer(src)
+    func = Compiler().compile(Parser(lex.tokenize()).parse()).consts[0]
+    assert [i.op for i in func.instructions][:2] == [FAST_MUL_FF, FAST_DIV_FC]
+    assert run_source_and_capture(src).strip() == "10.0"
+
+
+def test_hot_function_is_promoted():
+    calls = "".join("দেখাও(inc(%d))\n" % i for i in range(VM.HOT_THRESHOLD + 2))
+    src = 'ফাংশন inc(a):\n  ফলাফল a + 1\n\n' + calls
+    lex = Lexer(src)
+    codeobj = Compiler().compile(Parser(lex.tokenize()).parse())
+    VM().run_code(codeobj)
+    func = codeobj.consts[0]
+    assert func.calls == VM.HOT_THRESHOLD + 2
+    assert func.threaded is not None
+    assert func.pyfunc is not None
+    out = run_source_and_capture(src).split()
+    assert out == [str(i + 1) for i in range(VM.HOT_THRESHOLD + 2)]
+
+
+def test_to_python_source_straight_line():
+    src = 'ফাংশন f(a, b):\n  c = a * b\n  ফলাফল c + 1\n'
+    lex = Lexer(src)
+    func = Compiler().compile(Parser(lex.tokenize()).parse()).consts[0]
+    assert Compiler.to_python_source(func) == (
+        "def __bpl_fn(_vm, _g, _v0, _v1):\n"
+        "    _v2 = (_v0 * _v1)\n"
+        "    return (_v2 + 1)\n"
+    )
+    assert Compiler.to_python_function(func)(VM(), {}, 4, 3) == 13
+
+
+def test_constants_keep_their_type():
+    src = 'দেখাও(1, 1.0, সত্য, 1)\n'
+    lex = Lexer(src)
+    codeobj = Compiler().compile(Parser(lex.tokenize()).parse())
+    assert codeobj.consts == [1, 1.0, True]
+    assert [type(c) for c in codeobj.consts] == [int, float, bool]
+    assert run_source_and_capture(src).strip() == "1 1.0 True 1"
+    # A folded negative zero is not merged with 0.0
+    assert run_source_and_capture("দেখাও(0.0, 0.0 * (0 - 1))\n").strip() == "0.0 -0.0"
+
+
+def test_if_while_and_recursion():
+    src = (
+        "ফাংশন f(n):\n    যদি n == 0:\n        ফলাফল 1\n    নইলে:\n        ফলাফল n * f(n - 1)\n\n"
+        "i = 0\ns = 0\nযখন i < 5:\n    s = s + i\n    i = i + 1\n"
+        "দেখাও(f(5), s, 7 % 3, সত্য এবং মিথ্যা, না মিথ্যা)\n"
+    )
+    assert run_source_and_capture(src).strip() == "120 10 1 False True"
+
+
+def test_cli_runs_through_vm(capsys):
+    from bangla_lang.cli import run_source
+    run_source("ফাংশন sq(x):\n    ফলাফল x * x\nদেখাও(sq(7))\n")
+    assert capsys.readouterr().out.strip() == "49"
+
+
+def test_load_name_cache_sees_rebinding():
+    src = "x = 1\nফাংশন g():\n    ফলাফল x\nদেখাও(g())\nx = 2\nদেখাও(g())\n"
+    assert run_source_and_capture(src).split() == ["1", "2"]
+
+
+def test_profile_counts_opcodes():
+    src = "i = 0\nযখন i < 3:\n    i = i + 1\n"
+    lex = Lexer(src)
+    codeobj = Compiler().compile(Parser(lex.tokenize()).parse())
+    vm = VM(profile=True)
+    vm.run_code(codeobj)
+    counts = dict(vm.profile_report())
+    assert counts["COMPARE_LT"] == 4
+    assert counts["POP_JUMP_IF_FALSE"] == 4
+    assert counts["JUMP_ABSOLUTE"] == 3
+
+
+def test_peephole_return_const_and_dead_constants():
+    src = "ফাংশন h(a):\n    ৫\n    যদি a:\n        ফলাফল\n    ফলাফল 3\nদেখাও(h(1), h(0))\n"
+    lex = Lexer(src)
+    func = Compiler().compile(Parser(lex.tokenize()).parse()).consts[0]
+    ops = [i.op for i in func.instructions]
+    assert LOAD_CONST not in ops and POP_TOP not in ops
+    assert ops.count(RETURN_CONST) == 2
+    assert run_source_and_capture(src).strip() == "None 3"
+
+
+def test_constant_folding():
+    codeobj = Compiler().compile(Parser(Lexer("x = (1 + 2) * 4 > 10\n").tokenize()).parse())
+    assert codeobj.ops[0] == LOAD_CONST
+    assert codeobj.consts[codeobj.args[0]] is True
+    # Division by zero is left for the VM to report at run time
+    codeobj = Compiler().compile(Parser(Lexer("x = 1 / 0\n").tokenize()).parse())
+    assert BINARY_DIV in codeobj.ops
+
+
+def test_call_return_fusion():
+    src = "ফাংশন g(n):\n    ফলাফল n + 1\nফাংশন f(n):\n    ফলাফল g(n * 2)\nদেখাও(f(3))\n"
+    codeobj = Compiler().compile(Parser(Lexer(src).tokenize()).parse())
+    f_code = codeobj.consts[1]
+    assert CALL_RETURN in f_code.ops
+    assert run_source_and_capture(src).strip() == "7"
+
+
+def test_function_frames_resolve_names_through_globals():
+    src = "x = 5\ny = 7\nফাংশন f(x):\n    ফলাফল x + y\nদেখাও(f(1), x)\n"
+    assert run_source_and_capture(src).split() == ["8", "5"]
+
+
+@pytest.mark.parametrize("src, expected", [
+    # A nested function reads the enclosing function's locals
+    ("ফাংশন f(n):\n    ফাংশন g():\n        ফলাফল n + 1\n    ফলাফল g()\nদেখাও(f(6))\n", "7"),
+    # ... including its own name, to recurse
+    ("ফাংশন f():\n    ফাংশন inner(k):\n        যদি k == 0:\n            ফলাফল 0\n"
+     "        ফলাফল k + inner(k - 1)\n    ফলাফল inner(4)\nদেখাও(f())\n", "10"),
+    # A local read before its first assignment is the global
+    ("x = 5\nফাংশন f():\n    y = x\n    x = 1\n    ফলাফল y\nদেখাও(f(), x)\n", "5 5"),
+])
+def test_scoping_matches_evaluator(src, expected, capsys):
+    run_program(Parser(Lexer(src).tokenize()).parse())
+    assert capsys.readouterr().out.strip() == expected
+    assert run_source_and_capture(src).strip() == expected
+
+
+def test_peephole_drops_unreachable_code():
+    src = "ফাংশন add(a, b):\n    ফলাফল a + b\n\nফাংশন g(a):\n    যদি a:\n        ফলাফল 1\n    নইলে:\n        ফলাফল 2\n"
+    codeobj = Compiler().compile(Parser(Lexer(src).tokenize()).parse())
+    add, g = codeobj.consts[0], codeobj.consts[1]
+    assert [i.op for i in add.instructions] == [FAST_ADD_FF, RETURN_VALUE]
+    # Neither the jump over the else branch nor the implicit return survive
+    assert [OPNAMES[op] for op in g.ops] == [
+        "LOAD_FAST", "POP_JUMP_IF_FALSE", "RETURN_CONST", "RETURN_CONST",
+    ]
+    assert run_source_and_capture(src + "দেখাও(add(2, 3), g(1), g(0))\n").strip() == "5 1 2"
+
+
+def test_code_is_frozen_after_compile():
+    codeobj = Compiler().compile(Parser(Lexer("ফাংশন f(a):\n    ফলাফল a\nx = f(1)\n").tokenize()).parse())
+    for code in (codeobj, codeobj.consts[0]):
+        assert type(code.ops) is bytes and type(code.args) is tuple
+        assert len(code.ops) == len(code.args)
+
+
+def test_promoted_logical_ops_evaluate_both_operands():
+    n = VM.HOT_THRESHOLD + 4
+    src = 'ফাংশন f(x):\n    ফলাফল x এবং দেখাও("and")\nফাংশন g(x):\n    ফলাফল x বা দেখাও("or")\n'
+    src += "i = 0\nযখন i < %d:\n    f(মিথ্যা)\n    g(সত্য)\n    i = i + 1\n" % n
+    out = run_source_and_capture(src).split()
+    assert out.count("and") == n and out.count("or") == n
+
+
+@pytest.mark.parametrize("src, message", [
+    ("দেখাও(y)\n", "নাম ত্রুটি: অপরিচিত নাম 'y'"),
+    ('x = 1 + "a"\n', "টাইপ ত্রুটি: unsupported operand type(s) for +: 'int' and 'str'"),
+    ("x = 1 / 0\n", "টাইপ ত্রুটি: division by zero"),
+    ("x = 3\nx(1)\n", "নাম ত্রুটি: অপরিচিত ফাংশন 'x'"),
+    ('s = "abc"\ns()\n', "নাম ত্রুটি: অপরিচিত ফাংশন 's'"),
+    ("foo(1)\n", "নাম ত্রুটি: অপরিচিত ফাংশন 'foo'"),
+    ("ফাংশন f():\n    ফলাফল foo(1)\nf()\n", "নাম ত্রুটি: অপরিচিত ফাংশন 'foo'"),
+    ('ফাংশন f():\n    s = "abc"\n    ফলাফল s()\nf()\n', "নাম ত্রুটি: অপরিচিত ফাংশন 's'"),
+    # The callee is cached on the first iteration and then rebound
+    ("ফাংশন f():\n    ফলাফল 1\ni = 0\nযখন i < 3:\n    f()\n    f = i\n    i = i + 1\n",
+     "নাম ত্রুটি: অপরিচিত ফাংশন 'f'"),
+])
+def test_runtime_errors_match_evaluator(src, message):
+    with pytest.raises(RuntimeErrorBPL) as evaluated:
+        run_program(Parser(Lexer(src).tokenize()).parse())
+    with pytest.raises(RuntimeErrorBPL) as compiled:
+        run_source_and_capture(src)
+    assert str(evaluated.value) == str(compiled.value) == message
+
+
+def test_wrong_argument_count_is_an_error():
+    src = "ফাংশন f(a):\n    ফলাফল a\n"
+    with pytest.raises(RuntimeErrorBPL, match="f প্রত্যাশা 1 আর্গুমেন্ট কিন্তু পেয়েছে 2"):
+        run_source_and_capture(src + "f(1, 2)\n")
+    # Also once f has been promoted to a generated Python function
+    calls = "f(1)\n" * (VM.HOT_THRESHOLD + 1)
+    with pytest.raises(RuntimeErrorBPL, match="পেয়েছে 0"):
+        run_source_and_capture(src + calls + "f()\n")
+
+
+def test_promoted_functions_keep_unrepresentable_constants():
+    # A float literal too large for a double is inf, and folding can build
+    # an int too long for repr(); neither may be written into the source
+    big = "9" * 4000
+    src = "ফাংশন f(a):\n    ফলাফল a * %s.0\nফাংশন g(a):\n    ফলাফল a + %s * %s\n" % ("1" * 400, big, big)
+    src += "i = 0\nযখন i < %d:\n    x = f(1)\n    y = g(0)\n    i = i + 1\nদেখাও(x, y == %s * %s)\n" % (
+        VM.HOT_THRESHOLD + 4, big, big)
+    assert run_source_and_capture(src).split() == ["inf", "True"]
+
+
+def test_profile_counts_functions_promoted_by_another_vm():
+    calls = "inc(1)\n" * (VM.HOT_THRESHOLD + 1)
+    codeobj = Compiler().compile(Parser(Lexer("ফাংশন inc(a):\n    ফলাফল a + 1\n" + calls).tokenize()).parse())
+    VM().run_code(codeobj)
+    assert codeobj.consts[0].pyfunc is not None
+    vm = VM(profile=True)
+    vm.run_code(codeobj)
+    assert dict(vm.profile_report())["FAST_ADD_FC"] == VM.HOT_THRESHOLD + 1
@@ -0,0 +1,62 @@
+import os
+import pickle
+
+from bangla_lang import _cache
+from bangla_lang.bytecode import VM
+from bangla_lang.compiler import Compiler
+from bangla_lang.lexer import lex
+from bangla_lang.parser import parse_tokens
+
+
+def test_cached_parse_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "CACHE_DIR", str(tmp_path))
+    _cache.cached_parse.cache_clear()
+    src = "ফাংশন f(n):\n    ফলাফল n * 2\nদেখাও(f(4))\n"
+    tree = _cache.cached_parse(src)
+    assert tree == parse_tokens(lex(src))
+    assert len(os.listdir(tmp_path)) == 1
+    # A fresh process would read the pickled tree back
+    _cache.cached_parse.cache_clear()
+    assert _cache.cached_parse(src) == tree
+    _cache.cached_parse.cache_clear()
+
+
+def test_corrupt_entry_is_reparsed(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "CACHE_DIR", str(tmp_path))
+    _cache.cached_parse.cache_clear()
+    src = "x = 1\n"
+    with open(_cache._cache_path(src), "wb") as f:
+        f.write(b"not a pickle")
+    assert _cache.cached_parse(src) == parse_tokens(lex(src))
+    _cache.cached_parse.cache_clear()
+
+
+def test_cached_compile_round_trip(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(_cache, "CACHE_DIR", str(tmp_path))
+    _cache.cached_parse.cache_clear()
+    _cache.cached_compile.cache_clear()
+    src = "ফাংশন f(n):\n    ফলাফল n * 2\nদেখাও(f(4))\n"
+    code = _cache.cached_compile(src)
+    assert code == Compiler().compile(parse_tokens(lex(src)))
+    assert sorted(os.listdir(tmp_path))[0].endswith(".bpc")
+    VM().run_code(code)
+    _cache.cached_parse.cache_clear()
+    _cache.cached_compile.cache_clear()
+    loaded = _cache.cached_compile(src)
+    assert loaded is not code and loaded == code
+    VM().run_code(loaded)
+    assert capsys.readouterr().out.split() == ["8", "8"]
+    _cache.cached_parse.cache_clear()
+    _cache.cached_compile.cache_clear()
+
+
+def test_code_object_pickles_after_running():
+    calls = "".join("দেখাও(inc(%d))\n" % i for i in range(VM.HOT_THRESHOLD + 1))
+    code = Compiler().compile(parse_tokens(lex("ফাংশন inc(a):\n    ফলাফল a + 1\n" + calls)))
+    # Leaves a generated pyfunc and profiling closures on the code objects
+    VM(builtins={"দেখাও": lambda *args: None}).run_code(code)
+    VM(builtins={"দেখাও": lambda *args: None}, profile=True).run_code(code)
+    assert code.consts[0].pyfunc is not None
+    loaded = pickle.loads(pickle.dumps(code))
+    assert loaded == code
+    assert loaded.consts[0].pyfunc is None and loaded.consts[0].calls == 0
@@ -0,0 +1,26 @@
+import pytest
+
+from bangla_lang.lexer import lex
+from bangla_lang.parser import parse_tokens
+from bangla_lang.evaluator import run_program
+from bangla_lang.errors import RuntimeErrorBPL
+
+
+def run(src):
+    return run_program(parse_tokens(lex(src)))
+
+
+def test_factorial(capsys):
+    src = "ফাংশন f(n):\n    যদি n == 0:\n        ফলাফল 1\n    নইলে:\n        ফলাফল n * f(n - 1)\n\nদেখাও(f(5))\n"
+    run(src)
+    assert capsys.readouterr().out.strip() == "120"
+
+
+def test_operators(capsys):
+    run("দেখাও(7 % 3, 2 <= 3, 1 != 1, সত্য এবং মিথ্যা, না মিথ্যা)\n")
+    assert capsys.readouterr().out.strip() == "1 True False False True"
+
+
+def test_type_error_is_wrapped():
+    with pytest.raises(RuntimeErrorBPL):
+        run('x = 1 + "a"\n')
@@ -1,7 +1,11 @@
+import gc
+import sys
+
 import pytest
 
-from bangla_lang.lexer import lex
+from bangla_lang.lexer import Lexer, lex
 from bangla_lang.tokens import IDENT, KEYWORD
+from bangla_lang.errors import LexError
 
 
 def test_bangla_identifier():
@@ -15,3 +19,62 @@ def test_keyword_jodi():
     src = "যদি সত্য:\n    মুদ্রণ(\"ok\")"
     toks = lex(src)
     assert any(t.type == KEYWORD and t.value == "যদি" for t in toks)
+
+
+def test_keyword_values_are_interned():
+    # Keyword tokens share the interned canonical string
+    toks = lex("যদি x:\n    ফলাফল না x\n")
+    keywords = [t.value for t in toks if t.type == KEYWORD]
+    assert keywords == ["যদি", "ফলাফল", "না"]
+    assert all(kw is sys.intern(kw) for kw in keywords)
+
+
+def test_string_escapes_and_operators():
+    toks = lex("x = 'a\\tb\\'' + \"\\\\\" # মন্তব্য\ny >= ৩.৫")
+    assert [(t.type, t.value) for t in toks if t.type not in ("NEWLINE", "EOF")] == [
+        ("IDENT", "x"), ("OP", "="), ("STRING", "a\tb'"), ("OP", "+"), ("STRING", "\\"),
+        ("IDENT", "y"), ("OP", ">="), ("NUMBER", 3.5),
+    ]
+
+
+def test_unterminated_string_and_bad_number():
+    with pytest.raises(LexError):
+        lex('x = "abc')
+    with pytest.raises(LexError):
+        lex("x = 5.")
+
+
+def test_tab_indentation_expands_only_prefix():
+    toks = lex("যদি সত্য:\n\tx = 'a\tb'\n")
+    indent = next(t for t in toks if t.type == "INDENT")
+    assert indent.value == 4
+    assert any(t.type == "STRING" and t.value == "a\tb" for t in toks)
+
+
+def test_lex_restores_gc_state():
+    assert gc.isenabled()
+    lex("x = 1\n")
+    assert gc.isenabled()
+    gc.disable()
+    try:
+        lex("x = 1\n")
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+def test_tokenize_many_matches_tokenize():
+    sources = ["যদি x:\n    ফলাফল x\n", "x = x + 1\n", "দেখাও('x', না x)\n"]
+    assert Lexer.tokenize_many(sources) == [lex(src) for src in sources]
+
+
+@pytest.mark.parametrize("src", ["x½ = 1", "x = ²", "³ = 1", "ক¼ = 1", "ক৴ = 1", "৹ = 1"])
+def test_numeric_only_characters_are_not_identifiers(src):
+    with pytest.raises(LexError):
+        lex(src)
+
+
+def test_astral_letters_start_identifiers():
+    toks = lex("\U0001d465ab১ = 1")
+    assert (toks[0].type, toks[0].value) == (IDENT, "\U0001d465ab১")
+    assert toks[1].col == 6
@@ -0,0 +1,29 @@
+import pytest
+
+from bangla_lang.errors import ParseError
+from bangla_lang.repl import Interp
+
+
+def test_names_persist_between_lines(capsys):
+    interp = Interp()
+    assert interp.feed("x = 5") is False
+    interp.feed("দেখাও(x * 2)")
+    assert capsys.readouterr().out.strip() == "10"
+
+
+def test_block_waits_for_blank_line(capsys):
+    interp = Interp()
+    assert interp.feed("ফাংশন f(n):") is True
+    assert interp.feed("    ফলাফল n + 1") is True
+    assert interp.feed("") is False
+    interp.feed("দেখাও(f(1))")
+    assert capsys.readouterr().out.strip() == "2"
+
+
+def test_error_discards_buffer():
+    interp = Interp()
+    interp.feed("যদি সত্য:")
+    interp.feed("    )")
+    with pytest.raises(ParseError):
+        interp.feed("")
+    assert interp.buffer == []
@@ -0,0 +1,62 @@
+"""Regenerate bangla_lang/_variants_table.py.
+
+Run from the repository root after editing KEYWORD_VARIANTS or
+LOGICAL_OPERATORS, or to target a newer Unicode database:
+
+    python tools/gen_variants.py
+"""
+import os
+import sys
+import unicodedata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bangla_lang import unicode_variants as uv  # noqa: E402
+
+OUTPUT = os.path.join(ROOT, "bangla_lang", "_variants_table.py")
+
+
+def _dict_lines(name, table):
+    yield f"{name} = {{"
+    for k, v in table.items():
+        yield f"    {k!r}: {v!r},"
+    yield "}"
+
+
+def render() -> str:
+    ranges = uv._combining_mark_ranges()
+    lines = [
+        '"""Precomputed Unicode tables for unicode_variants.',
+        "",
+        "Generated by tools/gen_variants.py; do not edit by hand.",
+        '"""',
+        "",
+        f"UNIDATA_VERSION = {unicodedata.unidata_version!r}",
+        "",
+        "# Inclusive runs of BMP combining marks (Mn, Mc, Me)",
+        "MARK_RANGES = [",
+    ]
+    for i in range(0, len(ranges), 4):
+        lines.append("    " + " ".join(f"({a:#06x}, {b:#06x})," for a, b in ranges[i:i + 4]))
+    lines.append("]")
+    lines.append("")
+    lines.append("# Source dicts the normalized tables below were built from")
+    lines.extend(_dict_lines("KEYWORD_VARIANTS", uv.KEYWORD_VARIANTS))
+    lines.append("")
+    lines.extend(_dict_lines("LOGICAL_OPERATORS", uv.LOGICAL_OPERATORS))
+    lines.append("")
+    lines.extend(_dict_lines("NORM_KEYWORD_VARIANTS", uv._normalized_keys(uv.KEYWORD_VARIANTS)))
+    lines.append("")
+    lines.extend(_dict_lines("NORM_LOGICAL_OPERATORS", uv._normalized_keys(uv.LOGICAL_OPERATORS)))
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    with open(OUTPUT, "w", encoding="utf-8") as f:
+        f.write(render())
+    print(f"wrote {os.path.relpath(OUTPUT, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()